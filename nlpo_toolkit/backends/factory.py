@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from functools import partial
+
 from nlpo_toolkit.nlp.contracts import (
     BuiltNLPBackend,
+    NLPBackend,
     NLPBackendInfo,
     NLPBackendSpec,
 )
@@ -11,29 +14,13 @@ class NLPBackendConfigError(ValueError):
     pass
 
 
-def create_nlp_backend(
-    spec: NLPBackendSpec,
-    *,
-    processors: tuple[str, ...],
-) -> BuiltNLPBackend:
+def _backend_info(spec: NLPBackendSpec) -> NLPBackendInfo:
     if spec.backend == "stanza":
-        from .stanza_backend import StanzaBackend
-
-        package = spec.stanza_package or "perseus"
-        backend = StanzaBackend(
-            lang=spec.language,
-            package=package,
+        return NLPBackendInfo(
+            name="stanza",
+            language=spec.language,
+            package=spec.stanza_package or "perseus",
             use_gpu=spec.use_gpu,
-            processors=",".join(processors),
-        )
-        return BuiltNLPBackend(
-            backend=backend,
-            info=NLPBackendInfo(
-                name="stanza",
-                language=spec.language,
-                package=package,
-                use_gpu=spec.use_gpu,
-            ),
         )
 
     if spec.backend == "transformers":
@@ -41,17 +28,54 @@ def create_nlp_backend(
             raise NLPBackendConfigError(
                 "nlp.model_name is required when nlp.backend=transformers"
             )
-        from .transformers_backend import TransformersBackend
-
-        backend = TransformersBackend(model_name=spec.model_name)
-        return BuiltNLPBackend(
-            backend=backend,
-            info=NLPBackendInfo(
-                name="transformers",
-                language=spec.language,
-                model=spec.model_name,
-                use_gpu=spec.use_gpu,
-            ),
+        return NLPBackendInfo(
+            name="transformers",
+            language=spec.language,
+            model=spec.model_name,
+            use_gpu=spec.use_gpu,
         )
 
     raise NLPBackendConfigError("nlp.backend must be one of: stanza, transformers")
+
+
+def _build_backend(
+    spec: NLPBackendSpec, processors: tuple[str, ...]
+) -> NLPBackend:
+    if spec.backend == "stanza":
+        from .stanza_backend import StanzaBackend
+
+        return StanzaBackend(
+            lang=spec.language,
+            package=spec.stanza_package or "perseus",
+            use_gpu=spec.use_gpu,
+            processors=",".join(processors),
+            batch_sizes=dict(spec.stanza_batch_sizes),
+        )
+
+    from .transformers_backend import TransformersBackend
+
+    return TransformersBackend(model_name=spec.model_name)
+
+
+def create_nlp_backend(
+    spec: NLPBackendSpec,
+    *,
+    processors: tuple[str, ...],
+) -> BuiltNLPBackend:
+    info = _backend_info(spec)
+    unknown = sorted(dict(spec.stanza_batch_sizes).keys() - set(processors))
+    if unknown:
+        raise NLPBackendConfigError(
+            "nlp.stanza_batch_sizes names processors that are not enabled: "
+            + ", ".join(unknown)
+        )
+    if spec.workers == 1:
+        return BuiltNLPBackend(backend=_build_backend(spec, processors), info=info)
+
+    from .process_pool import ProcessPoolNLPBackend
+
+    # Each worker process builds its own backend; the parent never loads a model.
+    backend = ProcessPoolNLPBackend(
+        partial(_build_backend, spec, processors), max_workers=spec.workers
+    )
+    return BuiltNLPBackend(backend=backend, info=info)
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import weakref
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+
+from nlpo_toolkit.nlp.contracts import NLPBackend, NLPDocument
+from nlpo_toolkit.worker_pool import validate_max_workers
+
+_WORKER_BACKEND: NLPBackend | None = None
+
+
+def _initialize_worker(factory: Callable[[], NLPBackend]) -> None:
+    global _WORKER_BACKEND
+    _WORKER_BACKEND = factory()
+
+
+def _annotate_in_worker(text: str) -> NLPDocument:
+    if _WORKER_BACKEND is None:
+        raise RuntimeError("NLP worker process was not initialized")
+    return _WORKER_BACKEND(text)
+
+
+class ProcessPoolNLPBackend:
+    """
+    Annotate texts in worker processes that each build their own backend once.
+
+    ``factory`` must be picklable; the pool is started on first use so that
+    building the backend never forks idle model-loading processes.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], NLPBackend],
+        *,
+        max_workers: int,
+        mp_context: BaseContext | None = None,
+    ):
+        validate_max_workers(max_workers)
+        self.factory = factory
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=_initialize_worker,
+                initargs=(self.factory,),
+            )
+            weakref.finalize(self, self._executor.shutdown)
+        return self._executor
+
+    def __call__(self, text: str) -> NLPDocument:
+        return self._pool().submit(_annotate_in_worker, text).result()
+
+    def process_batch(self, texts: Sequence[str]) -> tuple[NLPDocument, ...]:
+        """Annotate texts across the workers, returning documents in input order."""
+        if not texts:
+            return ()
+        return tuple(self._pool().map(_annotate_in_worker, texts))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
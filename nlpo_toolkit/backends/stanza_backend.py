@@ -1,3 +1,7 @@
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from operator import attrgetter
+
 from nlpo_toolkit.nlp.contracts import (
     NLPDocument,
     NLPSentence,
@@ -19,6 +23,12 @@ def parse_stanza_feats(raw: object) -> tuple[UDMorphFeature, ...]:
         return ()
     if not isinstance(raw, str):
         raise StanzaBackendDataError("Stanza feats must be a string")
+    return _parse_stanza_feats_string(raw)
+
+
+@lru_cache(maxsize=4096)
+def _parse_stanza_feats_string(raw: str) -> tuple[UDMorphFeature, ...]:
+    # Feats strings repeat heavily across a corpus, so each is parsed once.
     features = []
     for segment in raw.split("|"):
         if not segment or segment.count("=") != 1:
@@ -39,6 +49,20 @@ def parse_stanza_feats(raw: object) -> tuple[UDMorphFeature, ...]:
     return token.morphology
 
 
+_WORD_FIELDS = attrgetter("text", "lemma", "upos", "start_char", "end_char", "feats")
+
+
+def _defensive_word_fields(word) -> tuple[object, ...]:
+    return (
+        getattr(word, "text", ""),
+        getattr(word, "lemma", None),
+        getattr(word, "upos", None),
+        getattr(word, "start_char", None),
+        getattr(word, "end_char", None),
+        getattr(word, "feats", None),
+    )
+
+
 def convert_stanza_document_to_common_model(
     stanza_doc, original_text: str
 ) -> NLPDocument:
@@ -50,16 +74,21 @@ def convert_stanza_document_to_common_model(
             for token in stanza_sent.tokens:
                 words.extend(getattr(token, "words", []))
 
+        # Real Stanza words carry every field; only partial word-likes need getattr.
+        try:
+            word_fields = list(map(_WORD_FIELDS, words))
+        except AttributeError:
+            word_fields = list(map(_defensive_word_fields, words))
         tokens = tuple(
             NLPToken(
-                text=getattr(word, "text", ""),
-                lemma=getattr(word, "lemma", None),
-                upos=getattr(word, "upos", None),
-                start_char=getattr(word, "start_char", None),
-                end_char=getattr(word, "end_char", None),
-                morphology=parse_stanza_feats(getattr(word, "feats", None)),
+                text=text,
+                lemma=lemma,
+                upos=upos,
+                start_char=start_char,
+                end_char=end_char,
+                morphology=parse_stanza_feats(feats),
             )
-            for word in words
+            for text, lemma, upos, start_char, end_char, feats in word_fields
         )
         sentences.append(
             NLPSentence(tokens=tokens, text=getattr(stanza_sent, "text", None))
@@ -75,6 +104,7 @@ class StanzaBackend:
         use_gpu: bool = False,
         *,
         processors: str,
+        batch_sizes: Mapping[str, int] | None = None,
     ):
         try:
             import stanza
@@ -83,9 +113,19 @@ class StanzaBackend:
                 "The stanza backend requires the optional 'stanza' dependency"
             ) from exc
 
+        # Stanza reads per-processor batch sizes as ``<processor>_batch_size``.
+        batch_options = {
+            f"{processor}_batch_size": size
+            for processor, size in (batch_sizes or {}).items()
+        }
         self.pipeline = stanza.Pipeline(
-            lang=lang, processors=processors, package=package, use_gpu=use_gpu
+            lang=lang,
+            processors=processors,
+            package=package,
+            use_gpu=use_gpu,
+            **batch_options,
         )
+        self._document_type = stanza.Document
 
     def __call__(self, text: str) -> NLPDocument:
         """
@@ -95,5 +135,17 @@ class StanzaBackend:
         stanza_doc = self.pipeline(text)
         return convert_stanza_document_to_common_model(stanza_doc, text)
 
+    def process_batch(self, texts: Sequence[str]) -> tuple[NLPDocument, ...]:
+        """Annotate several texts in one bulk Stanza call, preserving order."""
+        if not texts:
+            return ()
+        stanza_docs = self.pipeline(
+            [self._document_type([], text=text) for text in texts]
+        )
+        return tuple(
+            convert_stanza_document_to_common_model(stanza_doc, text)
+            for stanza_doc, text in zip(stanza_docs, texts, strict=True)
+        )
+
     def _convert_to_common_model(self, stanza_doc, original_text: str) -> NLPDocument:
         return convert_stanza_document_to_common_model(stanza_doc, original_text)
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, Protocol
 
+from nlpo_toolkit.worker_pool import validate_max_workers
+
 
 CleanerKind = Literal["corpus_corporum", "scholastic_text"]
 CLEANER_KINDS: frozenset[str] = frozenset({"corpus_corporum", "scholastic_text"})
@@ -59,6 +61,10 @@ class CleanerConfigInspection:
 @dataclass(frozen=True)
 class CleanerExecutionRequest:
     inspection: CleanerConfigInspection
+    max_workers: int = 1
+
+    def __post_init__(self) -> None:
+        validate_max_workers(self.max_workers)
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import argparse
+
+
+def positive_int_argument(value: str) -> int:
+    """argparse ``type`` for ``--workers``-style options."""
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected a positive integer: {value!r}") from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer: {value!r}")
+    return number
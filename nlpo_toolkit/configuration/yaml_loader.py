@@ -8,6 +8,13 @@ import math
 import yaml
 from nlpo_toolkit.serialization.types import ConfigObject, ConfigValue
 
+# Use libyaml's parser when PyYAML was built with it; the constructor and
+# resolver are the same SafeLoader components either way.
+try:
+    from yaml import CSafeLoader as _BaseSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _BaseSafeLoader
+
 
 class YamlErrorKind(str, Enum):
     READ = "read"
@@ -39,7 +46,7 @@ class YamlLoadError(ValueError):
         return self.details.kind
 
 
-class _StrictSafeLoader(yaml.SafeLoader):
+class _StrictSafeLoader(_BaseSafeLoader):
     def __init__(self, stream: str, *, source_path: Path) -> None:
         super().__init__(stream)
         self.source_path = source_path
@@ -14,6 +14,7 @@ class AnalysisExtractionPolicy:
     chunk_chars: int = 200_000
     chunk_strategy: ChunkStrategy = "char_whitespace"
     processors: tuple[str, ...] = ("tokenize", "mwt", "pos", "lemma")
+    batch_chunks: int = 1
 
     def __post_init__(self) -> None:
         if (
@@ -22,6 +23,12 @@ class AnalysisExtractionPolicy:
             or self.chunk_chars <= 0
         ):
             raise ValueError("chunk_chars must be a positive integer")
+        if (
+            not isinstance(self.batch_chunks, int)
+            or isinstance(self.batch_chunks, bool)
+            or self.batch_chunks <= 0
+        ):
+            raise ValueError("batch_chunks must be a positive integer")
         if self.chunk_strategy != "char_whitespace":
             raise ValueError(f"Unsupported chunk strategy: {self.chunk_strategy}")
         if not self.processors:
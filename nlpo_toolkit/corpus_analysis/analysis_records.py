@@ -7,11 +7,13 @@ It must not depend on token artifact or diagnostic trace serialization.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Iterator
 
 from nlpo_toolkit.nlp.contracts import (
     NLPBackend,
+    NLPBatchBackend,
     NLPDocument,
     NLPSentence,
     UDMorphFeature,
@@ -151,6 +153,21 @@ def iter_nlp_analysis_records(
             global_index += 1
 
 
+def _iter_annotated_chunks(
+    text: str,
+    *,
+    nlp: NLPBackend,
+    policy: AnalysisExtractionPolicy,
+) -> Iterator[tuple[str, NLPDocument]]:
+    chunks = iter_analysis_chunks(text, policy=policy)
+    if policy.batch_chunks == 1 or not isinstance(nlp, NLPBatchBackend):
+        for chunk in chunks:
+            yield chunk, nlp(chunk)
+        return
+    while batch := tuple(islice(chunks, policy.batch_chunks)):
+        yield from zip(batch, nlp.process_batch(batch), strict=True)
+
+
 def iter_nlp_analysis_records_from_text(
     *,
     text: str,
@@ -163,8 +180,9 @@ def iter_nlp_analysis_records_from_text(
     global_index = 0
     chunk_base_offset = 0
 
-    for chunk_index, chunk in enumerate(iter_analysis_chunks(text, policy=policy)):
-        doc = nlp(chunk)
+    for chunk_index, (chunk, doc) in enumerate(
+        _iter_annotated_chunks(text, nlp=nlp, policy=policy)
+    ):
         emitted = 0
         for record in iter_nlp_analysis_records(
             document=doc,
@@ -64,6 +64,8 @@ def _to_backend_spec(config: NLPConfig) -> NLPBackendSpec:
         stanza_package=config.stanza_package,
         model_name=config.model_name,
         use_gpu=not config.cpu_only,
+        workers=config.workers,
+        stanza_batch_sizes=tuple(config.stanza_batch_sizes.items()),
     )
 
 
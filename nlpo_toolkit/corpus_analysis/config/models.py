@@ -19,6 +19,7 @@ from nlpo_toolkit.config_model import (
     ConfigModel,
     NonBlankStr,
     PositiveFiniteFloat,
+    PositiveStrictIntNumber,
 )
 from ..partition_models import PartitionSpec
 
@@ -65,6 +66,11 @@ class NLPConfig(ConfigModel):
     stanza_package: NonBlankStr | Mapping[StrictStr, StrictStr] | None = "perseus"
     model_name: NonBlankStr | None = None
     cpu_only: StrictBool = True
+    workers: PositiveStrictIntNumber = 1
+    batch_chunks: PositiveStrictIntNumber = 1
+    stanza_batch_sizes: Mapping[NonBlankStr, PositiveStrictIntNumber] = Field(
+        default_factory=dict
+    )
 
     @field_validator("stanza_package", mode="before")
     @classmethod
@@ -77,6 +83,9 @@ class NLPConfig(ConfigModel):
             raise ValueError("model_name is required when backend=transformers")
         if isinstance(self.stanza_package, Mapping):
             object.__setattr__(self, "stanza_package", freeze_mapping(self.stanza_package))
+        object.__setattr__(
+            self, "stanza_batch_sizes", freeze_mapping(self.stanza_batch_sizes)
+        )
         return self
 
     @field_serializer("stanza_package")
@@ -85,6 +94,10 @@ class NLPConfig(ConfigModel):
     ) -> str | dict[str, str] | None:
         return dict(value) if isinstance(value, Mapping) else value
 
+    @field_serializer("stanza_batch_sizes")
+    def serialize_stanza_batch_sizes(self, value: Mapping[str, int]) -> dict[str, int]:
+        return dict(value)
+
 
 class FilterConfig(ConfigModel):
     min_token_length: NonNegativeStrictInt = 0
@@ -7,9 +7,10 @@ reusable downstream analysis input.
 from __future__ import annotations
 
 import csv
+from collections.abc import Collection, Iterable, Sequence
 from pathlib import Path
 from types import TracebackType
-from typing import Collection, Protocol, Sequence, TextIO
+from typing import Protocol, TextIO
 
 from nlpo_toolkit.serialization.types import CsvScalar
 
@@ -35,6 +36,9 @@ DIAGNOSTIC_TRACE_COLUMNS = (
     "global_row",
 )
 
+_FLUSH_ROWS = 4096
+_WRITE_BUFFER_BYTES = 1 << 20
+
 
 class DiagnosticTraceWriter:
     def __init__(
@@ -51,12 +55,15 @@ class DiagnosticTraceWriter:
         self.write_truncation_marker = write_truncation_marker
         self._file: TextIO | None = None
         self._writer: RowWriter | None = None
+        self._pending: list[list[CsvScalar]] = []
         self._written = 0
         self._truncated = False
 
     def __enter__(self) -> "DiagnosticTraceWriter":
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = self.path.open("w", encoding="utf-8", newline="")
+        self._file = self.path.open(
+            "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_BYTES
+        )
         self._writer = csv.writer(self._file, delimiter="\t")
         self._writer.writerow(DIAGNOSTIC_TRACE_COLUMNS)
         return self
@@ -69,7 +76,7 @@ class DiagnosticTraceWriter:
             return
         if self.max_rows > 0 and self._written >= self.max_rows:
             if self.write_truncation_marker:
-                self._writer.writerow(
+                self._pending.append(
                     [
                         record.group,
                         record.chunk_index,
@@ -87,7 +94,7 @@ class DiagnosticTraceWriter:
                 )
             self._truncated = True
             return
-        self._writer.writerow(
+        self._pending.append(
             [
                 record.group,
                 record.chunk_index,
@@ -104,14 +111,26 @@ class DiagnosticTraceWriter:
             ]
         )
         self._written += 1
+        if len(self._pending) >= _FLUSH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._writer is not None and self._pending:
+            self._writer.writerows(self._pending)
+            self._pending.clear()
 
     def __exit__(
         self, exc_type: type[BaseException] | None,
         exc: BaseException | None, tb: TracebackType | None,
     ) -> None:
         if self._file is not None:
-            self._file.close()
+            try:
+                self._flush()
+            finally:
+                self._file.close()
 
 
 class RowWriter(Protocol):
     def writerow(self, row: Sequence[CsvScalar]) -> object: ...
+
+    def writerows(self, rows: Iterable[Sequence[CsvScalar]]) -> object: ...
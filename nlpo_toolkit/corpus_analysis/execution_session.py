@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from nlpo_toolkit.nlp.roman_numerals import load_roman_exceptions
 
 from .corpus import prepare_corpora
@@ -57,6 +59,12 @@ def start_nlp_execution_session(
 ) -> NLPExecutionSession:
     definition = corpus.plan.definition
     backend = dependencies.backend_factory(definition.config.nlp)
+    extraction_policy = dependencies.extraction_policy
+    nlp_config = definition.config.nlp
+    # Every worker process needs at least one chunk per batch.
+    batch_chunks = max(nlp_config.batch_chunks, nlp_config.workers)
+    if batch_chunks > extraction_policy.batch_chunks:
+        extraction_policy = replace(extraction_policy, batch_chunks=batch_chunks)
     roman_exceptions_path = definition.config_files.path(
         "filters.roman_exceptions_file"
     )
@@ -68,6 +76,6 @@ def start_nlp_execution_session(
     return NLPExecutionSession(
         corpus=corpus,
         backend=backend,
-        extraction_policy=dependencies.extraction_policy,
+        extraction_policy=extraction_policy,
         roman_exceptions=roman_exceptions,
     )
@@ -6,6 +6,9 @@ import unicodedata
 from .errors import FeatureError
 from .models import AnalyzedFeatureCorpus, CharacterNgramMode
 
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_SPACE_RUN_RE = re.compile(r" +")
+
 
 def normalize_character_stream(
     text: str, *, mode: CharacterNgramMode = CharacterNgramMode.FULL
@@ -14,7 +17,7 @@ def normalize_character_stream(
         raise FeatureError("character n-gram mode must be CharacterNgramMode")
     lowered = text.lower()
     if mode is CharacterNgramMode.FULL:
-        return re.sub(r"\s+", " ", lowered).strip()
+        return _WHITESPACE_RUN_RE.sub(" ", lowered).strip()
     if mode is CharacterNgramMode.LETTERS_ONLY:
         return "".join(
             character
@@ -30,7 +33,7 @@ def normalize_character_stream(
             else category.startswith(("L", "M"))
         )
         normalized.append(character if keep and not character.isspace() else " ")
-    return re.sub(r" +", " ", "".join(normalized)).strip()
+    return _SPACE_RUN_RE.sub(" ", "".join(normalized)).strip()
 
 
 def encode_character_ngram(value: str) -> str:
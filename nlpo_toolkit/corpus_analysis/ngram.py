@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from collections import Counter, defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Iterator
 
@@ -31,7 +32,9 @@ _HAS_WORD_CHAR_RE = re.compile(r"\w", re.UNICODE)
 _TOKEN_RE = re.compile(r"[^\W\d_]+", re.UNICODE)
 
 
-def _normalize_item(value: object) -> str | None:
+@lru_cache(maxsize=65536)
+def _normalize_item(value: str | None) -> str | None:
+    # Token values repeat heavily (Zipf), so each distinct value is checked once.
     item = str(value or "").strip()
     if not item or not _HAS_WORD_CHAR_RE.search(item):
         return None
@@ -61,8 +64,8 @@ class NgramRow:
 def _append_run(
     counter: Counter[str], run: list[str], *, n: int,
 ) -> None:
-    for index in range(len(run) - n + 1):
-        counter[" ".join(run[index:index + n])] += 1
+    # zip stops at the shortest slice, giving exactly len(run) - n + 1 windows.
+    counter.update(map(" ".join, zip(*(run[offset:] for offset in range(n)))))
 
 
 def build_ngrams_from_sequences(
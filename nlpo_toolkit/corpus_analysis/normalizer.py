@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from itertools import filterfalse
 
 from .config import NormalizationConfig
 
+_BRACKET_QUOTE_RE = re.compile(r'([()\[\]{}“”‘’\'"«»])')
+_HORIZONTAL_SPACE_RE = re.compile(r'[ \t]+')
+
 
 def strip_diacritics(text: str) -> str:
     decomposed = unicodedata.normalize("NFD", text)
-    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    if decomposed.isascii():
+        return decomposed
+    return "".join(filterfalse(unicodedata.combining, decomposed))
 
 
 def normalize_text(text: str, config: NormalizationConfig) -> str:
@@ -33,7 +39,7 @@ def normalize_text(text: str, config: NormalizationConfig) -> str:
     if config.strip_diacritics:
         text = strip_diacritics(text)
 
-    text = re.sub(r'([()\[\]{}“”‘’\'"«»])', r' \1 ', text)
-    text = re.sub(r'[ \t]+', ' ', text)
+    text = _BRACKET_QUOTE_RE.sub(r' \1 ', text)
+    text = _HORIZONTAL_SPACE_RE.sub(' ', text)
 
     return text
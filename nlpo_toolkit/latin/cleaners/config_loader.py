@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import cast
 from nlpo_toolkit.serialization.types import ConfigObject
@@ -91,10 +92,17 @@ def resolve_cleaner_input_files(input_path: Path) -> tuple[Path, ...]:
     if path.is_file():
         return (path,)
     if path.is_dir():
+        # Directory entries carry their file type, so only symlinks need a stat
+        # and a resolve; everything else already sits under the resolved path.
+        with os.scandir(path) as entries:
+            selected = sorted(
+                (Path(entry.path), entry.is_symlink())
+                for entry in entries
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() == ".txt"
+            )
         return tuple(
-            candidate.resolve()
-            for candidate in sorted(path.iterdir())
-            if candidate.is_file() and candidate.suffix.lower() == ".txt"
+            candidate.resolve() if linked else candidate
+            for candidate, linked in selected
         )
     raise CleanerConfigValidationError(f"Cleaner input does not exist: {path}")
 
@@ -1,4 +1,5 @@
 import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from ..models import CleanerProfile
@@ -8,18 +9,20 @@ HEADER_HASH_RE = re.compile(r"^\s*#{5,}\s*$")
 DEFAULT_RULES_PATH = Path(__file__).resolve().parents[1] / "patterns" / "corpus_corporum.yml"
 
 
-def prepare_lines(text: str) -> tuple[str, ...]:
-    lines = text.splitlines()
-    start = 0
-    for index, line in enumerate(lines):
+def select_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Drop everything up to the ``#####`` header; only lines before it are buffered."""
+    iterator = iter(lines)
+    preamble: list[str] = []
+    for line in iterator:
         if HEADER_HASH_RE.match(line):
-            start = index + 1
-            break
-    return tuple(lines[start:])
+            yield from iterator
+            return
+        preamble.append(line)
+    yield from preamble
 
 
 def finalize_line(line: str) -> str:
-    return line.replace("\t", " ")
+    return line.replace("\t", " ") if "\t" in line else line
 
 
-PROFILE = CleanerProfile("corpus_corporum", DEFAULT_RULES_PATH, prepare_lines, finalize_line)
+PROFILE = CleanerProfile("corpus_corporum", DEFAULT_RULES_PATH, finalize_line, select_lines)
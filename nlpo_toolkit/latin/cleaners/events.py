@@ -1,23 +1,79 @@
 from __future__ import annotations
 
 import csv
-from collections.abc import Sequence
+import re
+from collections.abc import Iterable, Sequence
 from pathlib import Path
+from types import TracebackType
+from typing import Protocol, Self, TextIO
 
 from .models import RefEvent
 
 
 _COLUMNS = ("doc_id", "kind", "rule_name", "action", "line_no", "match_count", "ref_key", "ref_author", "ref_work", "ref_loc", "text_snippet")
+_FIELD_SEPARATORS = len(_COLUMNS) - 1
+_LINE_TERMINATOR = csv.excel.lineterminator
+_HEADER = "\t".join(_COLUMNS) + _LINE_TERMINATOR
+# Characters that make csv.writer quote a field; rows without them are written directly.
+_QUOTED_CHARS_RE = re.compile(r'["\r\n]')
 
 
-def write_ref_events(path: str | Path, events: Sequence[RefEvent]) -> None:
-    target = Path(path)
-    target.parent.mkdir(parents=True, exist_ok=True)
-    temporary = target.with_name(f"{target.name}.tmp")
-    with temporary.open("w", encoding="utf-8", newline="") as stream:
-        writer = csv.writer(stream, delimiter="\t")
-        writer.writerow(_COLUMNS)
+class _RowWriter(Protocol):
+    def writerow(self, row: Iterable[object]) -> object: ...
+
+
+def _row(event: RefEvent) -> tuple[object, ...]:
+    reference = event.reference
+    return (event.doc_id, event.kind, event.rule_name, event.action, event.line_number, event.match_count, reference.key, reference.author, reference.work, reference.location, event.text_snippet)
+
+
+class RefEventSink:
+    """Stream events for one run into a temporary file that replaces ``path`` on success."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._temporary = self.path.with_name(f"{self.path.name}.tmp")
+        self._stream: TextIO | None = None
+        self._writer: _RowWriter | None = None
+        self.event_count = 0
+
+    def __enter__(self) -> Self:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = self._temporary.open("w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._stream, delimiter="\t")
+        self._stream.write(_HEADER)
+        return self
+
+    def extend(self, events: Iterable[RefEvent]) -> None:
+        if self._stream is None or self._writer is None:
+            raise RuntimeError("RefEventSink is not open")
+        write = self._stream.write
         for event in events:
-            reference = event.reference
-            writer.writerow((event.doc_id, event.kind, event.rule_name, event.action, event.line_number, event.match_count, reference.key, reference.author, reference.work, reference.location, event.text_snippet))
-    temporary.replace(target)
+            row = _row(event)
+            line = "\t".join(map(str, row))
+            if line.count("\t") == _FIELD_SEPARATORS and _QUOTED_CHARS_RE.search(line) is None:
+                write(line + _LINE_TERMINATOR)
+            else:
+                self._writer.writerow(row)
+            self.event_count += 1
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            if self._stream is not None:
+                self._stream.close()
+            if exc_type is None:
+                self._temporary.replace(self.path)
+        finally:
+            self._stream = None
+            self._writer = None
+            self._temporary.unlink(missing_ok=True)
+
+
+def write_ref_events(path: str | Path, events: Sequence[RefEvent]) -> None:
+    with RefEventSink(path) as sink:
+        sink.extend(events)
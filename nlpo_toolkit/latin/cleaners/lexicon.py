@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 from types import MappingProxyType
 
@@ -11,9 +12,27 @@ from .errors import CleanerLexiconError
 LexiconMap = Mapping[str, str]
 EMPTY_LEXICON_MAP: LexiconMap = MappingProxyType({})
 
+_WORD_RE = re.compile(r"\w+")
+_WORD_SPLIT_RE = re.compile(r"(\w+)")
+# Below this size a keyword alternation is cheaper than looking up every word.
+_WORD_LOOKUP_MIN_KEYS = 32
+
 
 def load_lexicon_map(path: str | Path) -> LexiconMap:
     source = Path(path).resolve()
+    try:
+        stat = source.stat()
+    except OSError:
+        return _read_lexicon_map(source)
+    return _cached_lexicon_map(source, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _cached_lexicon_map(source: Path, mtime_ns: int, size: int) -> LexiconMap:
+    return _read_lexicon_map(source)
+
+
+def _read_lexicon_map(source: Path) -> LexiconMap:
     try:
         lines = source.read_text(encoding="utf-8").splitlines()
     except (OSError, UnicodeError) as exc:
@@ -35,6 +54,23 @@ def load_lexicon_map(path: str | Path) -> LexiconMap:
 def apply_lexicon_map(text: str, mapping: Mapping[str, str]) -> str:
     if not text or not mapping:
         return text
-    keys = sorted(mapping, key=len, reverse=True)
-    pattern = re.compile(r"\b(" + "|".join(re.escape(key) for key in keys) + r")\b")
+    pattern = _compile_lexicon_keys(frozenset(mapping))
+    if pattern is None:
+        return _replace_whole_words(text, mapping)
     return pattern.sub(lambda match: mapping.get(match.group(1), match.group(1)), text)
+
+
+@lru_cache(maxsize=8)
+def _compile_lexicon_keys(keys: frozenset[str]) -> re.Pattern[str] | None:
+    """Return the longest-first key alternation, or None when whole-word lookup applies."""
+    if len(keys) >= _WORD_LOOKUP_MIN_KEYS and all(_WORD_RE.fullmatch(key) for key in keys):
+        return None
+    ordered = sorted(keys, key=lambda key: (-len(key), key))
+    return re.compile(r"\b(" + "|".join(re.escape(key) for key in ordered) + r")\b")
+
+
+def _replace_whole_words(text: str, mapping: Mapping[str, str]) -> str:
+    # A word-only key bounded by \b on both sides can only match a whole \w+ run,
+    # so one dictionary lookup per run replaces trying every key at every word.
+    get = mapping.get
+    return "".join([get(part, part) for part in _WORD_SPLIT_RE.split(text)])
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
 from re import Pattern
-from typing import Literal
+from typing import Literal, NamedTuple
 
 from nlpo_toolkit.cleaner_contracts import CleanerKind
 from nlpo_toolkit.immutable_collections import freeze_mapping
 
+from .prefilter import required_literal
+
 
 RuleAction = Literal["drop_line", "substitute"]
 
+_DEFAULT_PATTERN_FLAGS = re.compile("").flags
+# Backreferences and conditionals address groups by number, which shifts once a
+# pattern is wrapped into a larger alternation.
+_UNFUSABLE_SYNTAX_RE = re.compile(r"\\(?:[1-9]|g<)|\(\?P=|\(\?\(")
+
 
 @dataclass(frozen=True)
 class RuleReference:
@@ -26,6 +34,10 @@ class LineRemoveRule:
     pattern: Pattern[str]
     reference: RuleReference = RuleReference()
     name: str = ""
+    required_literal: str = field(init=False, default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "required_literal", required_literal(self.pattern))
 
 
 @dataclass(frozen=True)
@@ -34,20 +46,66 @@ class SubstituteRule:
     replacement: str
     reference: RuleReference = RuleReference()
     name: str = ""
+    required_literal: str = field(init=False, default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "required_literal", required_literal(self.pattern))
+
+
+@dataclass(frozen=True)
+class FusedRemoveRules:
+    """Remove rules compiled into one alternation, tried in rule order.
+
+    ``rules_by_group`` maps the capture group wrapping each rule, which is the
+    match's ``lastindex``, back to that rule.
+    """
+
+    pattern: Pattern[str]
+    rules_by_group: tuple[LineRemoveRule | None, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "rules_by_group", tuple(self.rules_by_group))
+
+
+def _fuse_remove_rules(rules: tuple[LineRemoveRule, ...]) -> FusedRemoveRules | None:
+    if len(rules) < 2:
+        return None
+    for rule in rules:
+        if rule.pattern.flags != _DEFAULT_PATTERN_FLAGS or _UNFUSABLE_SYNTAX_RE.search(rule.pattern.pattern):
+            return None
+    try:
+        pattern = re.compile("|".join(f"({rule.pattern.pattern})" for rule in rules))
+    except re.error:
+        return None
+    rules_by_group: list[LineRemoveRule | None] = [None]
+    for rule in rules:
+        rules_by_group.append(rule)
+        rules_by_group.extend([None] * rule.pattern.groups)
+    return FusedRemoveRules(pattern, tuple(rules_by_group))
+
+
+# (required literal, bound ``pattern.subn``, replacement, rule), unpacked per line
+# by the engine instead of reading four attributes off each rule.
+SubstitutionStep = tuple[str, Callable[[str, str], tuple[str, int]], str, SubstituteRule]
 
 
 @dataclass(frozen=True)
 class RuleSet:
     remove_lines: tuple[LineRemoveRule, ...] = ()
     substitutions: tuple[SubstituteRule, ...] = ()
+    fused_remove_lines: FusedRemoveRules | None = field(init=False, default=None, repr=False, compare=False)
+    substitution_steps: tuple[SubstitutionStep, ...] = field(init=False, default=(), repr=False, compare=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "remove_lines", tuple(self.remove_lines))
         object.__setattr__(self, "substitutions", tuple(self.substitutions))
+        object.__setattr__(self, "fused_remove_lines", _fuse_remove_rules(self.remove_lines))
+        object.__setattr__(self, "substitution_steps", tuple((rule.required_literal, rule.pattern.subn, rule.replacement, rule) for rule in self.substitutions))
 
 
-@dataclass(frozen=True)
-class RefEvent:
+class RefEvent(NamedTuple):
+    """One rule hit; a tuple because the engine allocates one per match."""
+
     doc_id: str
     kind: CleanerKind
     rule_name: str
@@ -77,12 +135,17 @@ class CleaningResult:
         object.__setattr__(self, "events", tuple(self.events))
 
 
+def _keep_all_lines(lines: Iterable[str]) -> Iterable[str]:
+    return lines
+
+
 @dataclass(frozen=True)
 class CleanerProfile:
     kind: CleanerKind
     default_rules_path: Path
-    prepare_lines: Callable[[str], tuple[str, ...]]
     finalize_line: Callable[[str], str]
+    # Picks the document lines to clean; the default keeps every line.
+    select_lines: Callable[[Iterable[str]], Iterable[str]] = _keep_all_lines
 
 
 @dataclass(frozen=True)
@@ -1,8 +1,37 @@
+import io
 import re
+from collections.abc import Iterable
 
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
 
-def normalize_cleaned_text(lines: tuple[str, ...]) -> str:
-    text = "\n".join(lines)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r" {2,}", " ", text)
-    return text.strip() + "\n"
+
+def normalize_cleaned_text(lines: Iterable[str]) -> str:
+    """Return ``"\\n".join(lines)`` with blank-line and space runs collapsed and ends stripped.
+
+    Lines are consumed one at a time, so the unnormalized document is never
+    joined into one string.
+    """
+    output = io.StringIO()
+    pending: str | None = None
+    gap: list[str] = []
+    for line in lines:
+        for piece in line.split("\n") if "\n" in line else (line,):
+            if "  " in piece:
+                piece = _MULTI_SPACE_RE.sub(" ", piece)
+            if not piece or piece.isspace():
+                if pending is not None:
+                    gap.append(piece)
+                continue
+            if pending is None:
+                pending = piece.lstrip()
+                continue
+            output.write(pending)
+            output.write(_MULTI_NEWLINE_RE.sub("\n\n", "\n" + "\n".join(gap) + "\n") if gap else "\n")
+            pending = piece
+            gap.clear()
+    if pending is None:
+        return "\n"
+    output.write(pending.rstrip())
+    output.write("\n")
+    return output.getvalue()
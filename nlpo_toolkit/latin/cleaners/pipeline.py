@@ -1,22 +1,33 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 
 from nlpo_toolkit.cleaner_contracts import CleanerKind
 
 from .lexicon import EMPTY_LEXICON_MAP, apply_lexicon_map, load_lexicon_map
-from .models import CleanerProgram, CleanerProfile, CleaningResult, RuleSet
+from .models import CleanerProgram, CleanerProfile, CleaningResult, RefEvent, RuleSet
 from .normalization import normalize_cleaned_text
 from .registry import get_cleaner_profile
-from .rule_engine import apply_rule_set
+from .rule_engine import iter_rule_set
 from .rule_loader import load_rule_set
+from .text_reader import iter_text_lines
 
 
 def clean_document(text: str, *, profile: CleanerProfile, rules: RuleSet, lexicon_map: Mapping[str, str], doc_id: str = "", snippet_chars: int = 200) -> CleaningResult:
-    applied = apply_rule_set(profile.prepare_lines(text), rules=rules, kind=profile.kind, doc_id=doc_id, snippet_chars=snippet_chars, finalize_line=profile.finalize_line)
-    cleaned = apply_lexicon_map(normalize_cleaned_text(applied.lines), lexicon_map)
-    return CleaningResult(cleaned, applied.events)
+    return _clean_lines(profile.select_lines(text.splitlines()), profile=profile, rules=rules, lexicon_map=lexicon_map, doc_id=doc_id, snippet_chars=snippet_chars)
+
+
+def clean_file(path: str | Path, *, profile: CleanerProfile, rules: RuleSet, lexicon_map: Mapping[str, str], doc_id: str = "", snippet_chars: int = 200) -> CleaningResult:
+    """Clean a UTF-8 file as ``clean_document`` would, streaming its lines instead of reading it whole."""
+    return _clean_lines(profile.select_lines(iter_text_lines(path)), profile=profile, rules=rules, lexicon_map=lexicon_map, doc_id=doc_id, snippet_chars=snippet_chars)
+
+
+def _clean_lines(lines: Iterable[str], *, profile: CleanerProfile, rules: RuleSet, lexicon_map: Mapping[str, str], doc_id: str, snippet_chars: int) -> CleaningResult:
+    events: list[RefEvent] = []
+    kept = iter_rule_set(lines, rules=rules, kind=profile.kind, events=events, doc_id=doc_id, snippet_chars=snippet_chars, finalize_line=profile.finalize_line)
+    cleaned = apply_lexicon_map(normalize_cleaned_text(kept), lexicon_map)
+    return CleaningResult(cleaned, tuple(events))
 
 
 def load_cleaner_program(*, kind: CleanerKind, rules_path: Path | None, lexicon_map_path: Path | None) -> CleanerProgram:
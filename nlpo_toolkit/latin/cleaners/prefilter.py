@@ -0,0 +1,100 @@
+"""Literal prefilters that let the rule engine skip regexes which cannot match."""
+import re
+from re import Pattern
+
+MIN_PREFILTER_CHARS = 3
+_UNSUPPORTED_FLAGS = re.IGNORECASE | re.VERBOSE
+_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+_REPEAT_RE = re.compile(r"\{\d*(?:,\d*)?\}")
+_ESCAPE_ARGUMENT_CHARS = {"x": 2, "u": 4, "U": 8}
+
+
+def _skip_escape(source: str, index: int) -> int:
+    escaped = source[index + 1:index + 2]
+    index += 2
+    if escaped in _ESCAPE_ARGUMENT_CHARS:
+        return index + _ESCAPE_ARGUMENT_CHARS[escaped]
+    if escaped == "N":
+        return source.find("}", index) + 1 or len(source)
+    if escaped.isdigit():
+        while index < len(source) and source[index].isdigit():
+            index += 1
+    return index
+
+
+def _skip_class(source: str, index: int) -> int:
+    index += 1
+    if source.startswith("^", index):
+        index += 1
+    if source.startswith("]", index):
+        index += 1
+    while index < len(source) and source[index] != "]":
+        index += 2 if source[index] == "\\" else 1
+    return index + 1
+
+
+def _skip_group(source: str, index: int) -> int:
+    depth = 0
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            index = _skip_class(source, index)
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return index
+
+
+def required_literal(pattern: Pattern[str], *, min_chars: int = MIN_PREFILTER_CHARS) -> str:
+    """Return the longest top-level literal run that every match contains, or ``""``.
+
+    The scan is deliberately conservative: groups, classes, escapes other than
+    escaped punctuation, and quantified atoms all end a run, and a top-level
+    alternation or case-insensitive/verbose flags disable the prefilter.
+    """
+    source = pattern.pattern
+    # Comments are transparent to quantifiers, so "b(?#c)*" makes "b" optional.
+    if pattern.flags & _UNSUPPORTED_FLAGS or "(?#" in source:
+        return ""
+    best = run = ""
+    index = 0
+    while index < len(source):
+        char = source[index]
+        literal = ""
+        if char == "\\":
+            escaped = source[index + 1:index + 2]
+            if escaped and not (escaped.isascii() and escaped.isalnum()):
+                literal = escaped
+            index = _skip_escape(source, index)
+        elif char == "[":
+            index = _skip_class(source, index)
+        elif char == "(":
+            index = _skip_group(source, index)
+        elif char == "|":
+            return ""
+        elif char == "{":
+            repeat = _REPEAT_RE.match(source, index)
+            index = repeat.end() if repeat else index + 1
+        else:
+            if char not in ".^$*+?}])":
+                literal = char
+            index += 1
+        following = source[index:index + 1]
+        if literal and following not in _OPTIONAL_QUANTIFIERS:
+            run += literal
+            if following != "+":
+                continue
+        if len(run) > len(best):
+            best = run
+        run = ""
+    if len(run) > len(best):
+        best = run
+    return best if len(best) >= min_chars else ""
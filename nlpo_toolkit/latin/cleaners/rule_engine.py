@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 
 from nlpo_toolkit.cleaner_contracts import CleanerKind
 
@@ -20,24 +20,42 @@ def apply_rule_set(
     snippet_chars: int = 200,
     finalize_line: Callable[[str], str] = _identity,
 ) -> RuleApplicationResult:
-    output: list[str] = []
     events: list[RefEvent] = []
+    output = tuple(iter_rule_set(lines, rules=rules, kind=kind, events=events, doc_id=doc_id, snippet_chars=snippet_chars, finalize_line=finalize_line))
+    return RuleApplicationResult(output, tuple(events))
+
+
+def iter_rule_set(
+    lines: Iterable[str],
+    *,
+    rules: RuleSet,
+    kind: CleanerKind,
+    events: list[RefEvent],
+    doc_id: str = "",
+    snippet_chars: int = 200,
+    finalize_line: Callable[[str], str] = _identity,
+) -> Iterator[str]:
+    """Yield kept lines lazily, appending rule events to ``events`` as lines are consumed."""
+    remove_rules = rules.remove_lines
+    fused = rules.fused_remove_lines
+    substitutions = rules.substitution_steps
     for line_number, raw_line in enumerate(lines, 1):
         line = raw_line.rstrip("\n")
-        stripped = line.strip()
-        dropped = False
-        for rule in rules.remove_lines:
-            if rule.pattern.match(stripped):
-                events.append(RefEvent(doc_id, kind, rule.name, "drop_line", line_number, 1, rule.reference, line[:snippet_chars]))
-                dropped = True
-                break
-        if dropped:
-            continue
-        for rule in rules.substitutions:
-            match_count = sum(1 for _match in rule.pattern.finditer(line))
+        if remove_rules:
+            stripped = line.strip()
+            if fused is not None:
+                match = fused.pattern.match(stripped)
+                removed = fused.rules_by_group[match.lastindex] if match else None
+            else:
+                removed = next((rule for rule in remove_rules if rule.required_literal in stripped and rule.pattern.match(stripped)), None)
+            if removed is not None:
+                events.append(RefEvent(doc_id, kind, removed.name, "drop_line", line_number, 1, removed.reference, line[:snippet_chars]))
+                continue
+        for literal, subn, replacement, rule in substitutions:
+            if literal not in line:
+                continue
+            substituted, match_count = subn(replacement, line)
             if match_count:
-                snippet = line[:snippet_chars]
-                line = rule.pattern.sub(rule.replacement, line)
-                events.append(RefEvent(doc_id, kind, rule.name, "substitute", line_number, match_count, rule.reference, snippet))
-        output.append(finalize_line(line))
-    return RuleApplicationResult(tuple(output), tuple(events))
+                events.append(RefEvent(doc_id, kind, rule.name, "substitute", line_number, match_count, rule.reference, line[:snippet_chars]))
+                line = substituted
+        yield finalize_line(line)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 
 from nlpo_toolkit.configuration.yaml_loader import YamlLoadError, load_yaml_mapping
@@ -56,6 +57,19 @@ def _compile(pattern: str, *, path: Path, section: str, index: int) -> re.Patter
 
 def load_rule_set(path: str | Path) -> RuleSet:
     source = Path(path).resolve()
+    try:
+        stat = source.stat()
+    except OSError:
+        return _read_rule_set(source)
+    return _cached_rule_set(source, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _cached_rule_set(source: Path, mtime_ns: int, size: int) -> RuleSet:
+    return _read_rule_set(source)
+
+
+def _read_rule_set(source: Path) -> RuleSet:
     try:
         raw = load_yaml_mapping(source)
     except YamlLoadError as exc:
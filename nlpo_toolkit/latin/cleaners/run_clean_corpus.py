@@ -10,6 +10,7 @@ from nlpo_toolkit.cleaner_contracts import (
     CleanerExecutionRequest,
     CleanerExecutionResult,
 )
+from nlpo_toolkit.cli_arguments import positive_int_argument
 
 from .config_loader import inspect_cleaner_config
 from .service import execute_cleaner
@@ -28,6 +29,12 @@ def _parser() -> argparse.ArgumentParser:
         default=DEFAULT_CONFIG,
         help="Cleaner YAML config path.",
     )
+    parser.add_argument(
+        "--workers",
+        type=positive_int_argument,
+        default=1,
+        help="Number of worker processes used to clean input files (default: 1).",
+    )
     return parser
 
 
@@ -46,7 +53,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = _parser().parse_args(argv)
     try:
         inspection = inspect_cleaner_config(args.config)
-        result = execute_cleaner(CleanerExecutionRequest(inspection=inspection))
+        result = execute_cleaner(
+            CleanerExecutionRequest(inspection=inspection, max_workers=args.workers)
+        )
     except CleanerApplicationError as exc:
         print(f"[ERROR] {exc}", file=sys.stderr)
         return 1
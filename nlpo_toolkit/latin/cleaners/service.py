@@ -1,25 +1,27 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 from nlpo_toolkit.cleaner_contracts import (
     CleanedFileResult,
     CleanerApplicationError,
+    CleanerConfig,
     CleanerExecutionRequest,
     CleanerExecutionResult,
 )
 
 from .errors import (
     CleanerExecutionError,
-    CleanerInputReadError,
     CleanerOutputPlanError,
     CleanerOutputWriteError,
     CleanerTemplateError,
 )
-from .events import write_ref_events
+from .events import RefEventSink
 from .models import CleanerProgram, RefEvent
-from .pipeline import clean_document, load_cleaner_program
+from .pipeline import clean_file, load_cleaner_program
 
 
 @dataclass(frozen=True)
@@ -141,14 +143,8 @@ def _execute_file(
     plan: _CleanerFilePlan, *, program: CleanerProgram
 ) -> tuple[CleanedFileResult, tuple[RefEvent, ...]]:
     try:
-        raw = plan.input_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeError) as exc:
-        raise CleanerInputReadError(
-            f"Failed to read cleaner input as UTF-8: {plan.input_path}: {exc}"
-        ) from exc
-    try:
-        cleaned = clean_document(
-            raw,
+        cleaned = clean_file(
+            plan.input_path,
             profile=program.profile,
             rules=program.rules,
             lexicon_map=program.lexicon_map,
@@ -176,6 +172,65 @@ def _execute_file(
     )
 
 
+_worker_program: CleanerProgram | None = None
+
+
+def _initialize_worker(config: CleanerConfig) -> None:
+    global _worker_program
+    _worker_program = load_cleaner_program(
+        kind=config.kind,
+        rules_path=config.rules_path,
+        lexicon_map_path=config.lexicon_map_path,
+    )
+
+
+def _execute_file_in_worker(
+    plan: _CleanerFilePlan,
+) -> tuple[CleanedFileResult, tuple[RefEvent, ...]]:
+    if _worker_program is None:
+        raise CleanerExecutionError("Cleaner worker was not initialized")
+    return _execute_file(plan, program=_worker_program)
+
+
+def _execute_files_in_workers(
+    plans: tuple[_CleanerFilePlan, ...], *, config: CleanerConfig, max_workers: int
+) -> Iterator[tuple[CleanedFileResult, tuple[RefEvent, ...]]]:
+    # Each worker builds its own program: compiled rules are cached per
+    # process, and results come back in plan order.
+    workers = min(max_workers, len(plans))
+    executor = ProcessPoolExecutor(
+        max_workers=workers, initializer=_initialize_worker, initargs=(config,)
+    )
+    try:
+        yield from executor.map(_execute_file_in_worker, plans)
+    except BaseException:
+        # A failed or abandoned run must not keep cleaning and writing queued
+        # files; one file per task leaves only those already handed to a worker.
+        executor.shutdown(cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def _collect_results(
+    outcomes: Iterable[tuple[CleanedFileResult, tuple[RefEvent, ...]]],
+    *,
+    ref_tsv_path: Path | None,
+) -> tuple[CleanedFileResult, ...]:
+    if ref_tsv_path is None:
+        return tuple(result for result, _events in outcomes)
+    results: list[CleanedFileResult] = []
+    try:
+        with RefEventSink(ref_tsv_path) as sink:
+            for result, file_events in outcomes:
+                results.append(result)
+                sink.extend(file_events)
+    except OSError as exc:
+        raise CleanerOutputWriteError(
+            f"Failed to write cleaner reference events: {ref_tsv_path}: {exc}"
+        ) from exc
+    return tuple(results)
+
+
 def execute_cleaner(request: CleanerExecutionRequest) -> CleanerExecutionResult:
     inspection = request.inspection
     config = inspection.config
@@ -193,23 +248,15 @@ def execute_cleaner(request: CleanerExecutionRequest) -> CleanerExecutionResult:
             f"Failed to build cleaner program for {config.source_path}: {exc}"
         ) from exc
 
-    results: list[CleanedFileResult] = []
-    events: list[RefEvent] = []
-    for plan in plans:
-        result, file_events = _execute_file(plan, program=program)
-        results.append(result)
-        events.extend(file_events)
-    if config.ref_tsv_path is not None:
-        try:
-            write_ref_events(config.ref_tsv_path, events)
-        except OSError as exc:
-            raise CleanerOutputWriteError(
-                f"Failed to write cleaner reference events: {config.ref_tsv_path}: {exc}"
-            ) from exc
+    outcomes = (
+        _execute_files_in_workers(plans, config=config, max_workers=request.max_workers)
+        if request.max_workers > 1 and len(plans) > 1
+        else (_execute_file(plan, program=program) for plan in plans)
+    )
     return CleanerExecutionResult(
         config_path=config.source_path,
         kind=config.kind,
         configured_output_path=config.output_path,
-        files=tuple(results),
+        files=_collect_results(outcomes, ref_tsv_path=config.ref_tsv_path),
         ref_tsv_path=config.ref_tsv_path,
     )
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+from .errors import CleanerInputReadError
+
+
+def iter_text_lines(path: str | Path) -> Iterator[str]:
+    """Yield ``read_text(encoding="utf-8").splitlines()`` lazily from a memory-mapped file.
+
+    Each newline-terminated chunk is decoded on its own, so neither the raw
+    bytes nor the decoded document is held in memory at once.
+    """
+    source = Path(path)
+    try:
+        with source.open("rb") as stream:
+            if os.fstat(stream.fileno()).st_size == 0:
+                return
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                readline = mapped.readline
+                chunk = readline()
+                while chunk:
+                    yield from chunk.decode("utf-8").splitlines()
+                    chunk = readline()
+    except (OSError, UnicodeError) as exc:
+        raise CleanerInputReadError(
+            f"Failed to read cleaner input as UTF-8: {source}: {exc}"
+        ) from exc
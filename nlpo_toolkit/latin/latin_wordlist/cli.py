@@ -5,6 +5,8 @@ import sys
 from collections.abc import Sequence
 from pathlib import Path
 
+from nlpo_toolkit.cli_arguments import positive_int_argument
+
 from .composition import default_latin_wordlist_dependencies
 from .config import load_wordlist_build_request
 from .errors import LatinWordlistConfigError, LatinWordlistError
@@ -22,13 +24,19 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=DEFAULT_CONFIG_PATH,
         help="Path to the strict YAML configuration file",
     )
+    parser.add_argument(
+        "--workers",
+        type=positive_int_argument,
+        default=1,
+        help="Number of worker processes used to read source files (default: 1)",
+    )
     return parser.parse_args(argv)
 
 
 def run_cli(argv: Sequence[str] | None = None) -> int:
     args = parse_args(argv)
     try:
-        request = load_wordlist_build_request(args.config)
+        request = load_wordlist_build_request(args.config, max_workers=args.workers)
     except LatinWordlistConfigError as exc:
         print(f"[ERROR] {exc}", file=sys.stderr)
         return 2
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import stat
+from typing import TypeVar
+
+from nlpo_toolkit.worker_pool import pool_chunksize
 
 from .engine import iter_latin_word_candidates
 from .errors import LatinWordlistSourceReadError
@@ -16,6 +22,9 @@ from .models import (
 )
 
 
+_T = TypeVar("_T")
+
+
 def _read_text(path: Path) -> str:
     try:
         return path.read_text(encoding="utf-8")
@@ -25,6 +34,18 @@ def _read_text(path: Path) -> str:
         ) from exc
 
 
+def _iter_lines(path: Path) -> Iterator[str]:
+    """Yield ``_read_text(path).splitlines()`` without holding the whole file."""
+    try:
+        with path.open(encoding="utf-8") as stream:
+            for chunk in stream:
+                yield from chunk.splitlines()
+    except (OSError, UnicodeError) as exc:
+        raise LatinWordlistSourceReadError(
+            f"Failed to read Latin wordlist source {path} as UTF-8: {exc}"
+        ) from exc
+
+
 def _source_kind(path: Path, *, expected: str) -> bool:
     try:
         mode = path.stat().st_mode
@@ -51,8 +72,56 @@ def _sorted_source_files(directory: Path, pattern: str) -> tuple[Path, ...]:
         ) from exc
 
 
+def _map_source_files(
+    scan: Callable[[Path], _T], files: tuple[Path, ...], *, max_workers: int
+) -> Iterator[_T]:
+    """Apply ``scan`` to each file in order, in worker processes when asked to."""
+    if max_workers <= 1 or len(files) <= 1:
+        yield from map(scan, files)
+        return
+    workers = min(max_workers, len(files))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            scan, files, chunksize=pool_chunksize(len(files), workers)
+        )
+
+
+def _scan_conllu_file(
+    path: Path, *, min_length: int
+) -> tuple[set[str], Counter[str], int]:
+    lemmas: set[str] = set()
+    forms: list[str] = []
+    ignored_rows = 0
+    for line in _read_text(path).splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        # Only FORM and LEMMA are read, so leave the remaining columns unsplit.
+        columns = stripped.split("\t", 3)
+        if len(columns) < 3:
+            ignored_rows += 1
+            continue
+        form = columns[1].strip().lower()
+        lemma = columns[2].strip().lower()
+        if len(form) >= min_length and form.isalpha():
+            forms.append(form)
+        if len(lemma) >= min_length and lemma.isalpha():
+            lemmas.add(lemma)
+    return lemmas, Counter(forms), ignored_rows
+
+
+def _scan_text_file(
+    path: Path, *, policy: WordlistTokenizationPolicy, min_length: int
+) -> Counter[str]:
+    return Counter(
+        iter_latin_word_candidates(
+            _read_text(path), policy=policy, min_length=min_length
+        )
+    )
+
+
 def collect_conllu_candidates(
-    *, directory: Path, min_length: int
+    *, directory: Path, min_length: int, max_workers: int = 1
 ) -> tuple[ConlluCandidates, tuple[WordlistNotice, ...]]:
     if not _source_kind(directory, expected="directory"):
         notice = WordlistNotice(
@@ -66,22 +135,13 @@ def collect_conllu_candidates(
     lemmas: set[str] = set()
     form_counts: Counter[str] = Counter()
     ignored_rows = 0
-    for path in files:
-        text = _read_text(path)
-        for line in text.splitlines():
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            columns = stripped.split("\t")
-            if len(columns) < 3:
-                ignored_rows += 1
-                continue
-            form = columns[1].strip().lower()
-            lemma = columns[2].strip().lower()
-            if len(form) >= min_length and form.isalpha():
-                form_counts[form] += 1
-            if len(lemma) >= min_length and lemma.isalpha():
-                lemmas.add(lemma)
+    scan = partial(_scan_conllu_file, min_length=min_length)
+    for file_lemmas, file_forms, file_ignored in _map_source_files(
+        scan, files, max_workers=max_workers
+    ):
+        lemmas.update(file_lemmas)
+        form_counts.update(file_forms)
+        ignored_rows += file_ignored
     return ConlluCandidates(files, frozenset(lemmas), form_counts, ignored_rows), ()
 
 
@@ -90,6 +150,7 @@ def collect_text_candidates(
     directory: Path,
     policy: WordlistTokenizationPolicy,
     min_length: int,
+    max_workers: int = 1,
 ) -> tuple[TextCandidates, tuple[WordlistNotice, ...]]:
     if not _source_kind(directory, expected="directory"):
         notice = WordlistNotice(
@@ -101,12 +162,9 @@ def collect_text_candidates(
 
     files = _sorted_source_files(directory, "*.txt")
     form_counts: Counter[str] = Counter()
-    for path in files:
-        form_counts.update(
-            iter_latin_word_candidates(
-                _read_text(path), policy=policy, min_length=min_length
-            )
-        )
+    scan = partial(_scan_text_file, policy=policy, min_length=min_length)
+    for file_forms in _map_source_files(scan, files, max_workers=max_workers):
+        form_counts.update(file_forms)
     return TextCandidates(files, form_counts), ()
 
 
@@ -122,7 +180,7 @@ def collect_extra_wordlist_candidates(
         return None, (notice,)
 
     entries: set[str] = set()
-    for line in _read_text(path).splitlines():
+    for line in _iter_lines(path):
         candidate = line.strip()
         if not candidate or candidate.startswith("#"):
             continue
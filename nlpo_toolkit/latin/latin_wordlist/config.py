@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field, StrictInt, ValidationError, field_validator, model_validator
@@ -76,8 +77,30 @@ def _resolve_from(base: Path, path: Path) -> Path:
     return (base / path).resolve() if not path.is_absolute() else path.resolve()
 
 
-def load_wordlist_build_request(config_path: Path) -> LatinWordlistBuildRequest:
+def load_wordlist_build_request(
+    config_path: Path, *, max_workers: int = 1
+) -> LatinWordlistBuildRequest:
     source_path = config_path.expanduser().resolve()
+    try:
+        stat = source_path.stat()
+    except OSError:
+        return _read_wordlist_build_request(source_path, max_workers)
+    return _cached_wordlist_build_request(
+        source_path, stat.st_mtime_ns, stat.st_size, max_workers
+    )
+
+
+# typed=True keeps a bool max_workers from reusing the entry cached for 1.
+@lru_cache(maxsize=32, typed=True)
+def _cached_wordlist_build_request(
+    source_path: Path, mtime_ns: int, size: int, max_workers: int
+) -> LatinWordlistBuildRequest:
+    return _read_wordlist_build_request(source_path, max_workers)
+
+
+def _read_wordlist_build_request(
+    source_path: Path, max_workers: int
+) -> LatinWordlistBuildRequest:
     try:
         raw = load_yaml_mapping(source_path)
         config = LatinWordlistConfig.model_validate(raw)
@@ -115,4 +138,5 @@ def load_wordlist_build_request(config_path: Path) -> LatinWordlistBuildRequest:
         tokenization=WordlistTokenizationPolicy(
             extra_punct=config.tokenize.extra_punct
         ),
+        max_workers=max_workers,
     )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
 import string
 from collections.abc import Iterator, Mapping
+from functools import lru_cache
 
 from .models import (
     ConlluCandidates,
@@ -15,15 +17,19 @@ from .models import (
 def iter_latin_word_candidates(
     text: str, *, policy: WordlistTokenizationPolicy, min_length: int
 ) -> Iterator[str]:
-    punctuation = str.maketrans(
-        {character: " " for character in string.punctuation + policy.extra_punct}
-    )
-    for candidate in text.translate(punctuation).split():
+    for candidate in _candidate_pattern(policy.extra_punct).findall(text):
         word = candidate.lower()
         if len(word) >= min_length and word.isalpha():
             yield word
 
 
+@lru_cache(maxsize=8)
+def _candidate_pattern(extra_punct: str) -> re.Pattern[str]:
+    """Match the runs ``str.split()`` would return once punctuation became spaces."""
+    punctuation = "".join(re.escape(character) for character in string.punctuation + extra_punct)
+    return re.compile(rf"[^\s{punctuation}]+")
+
+
 def select_frequent_forms(
     counts: Mapping[str, int], *, minimum_frequency: int
 ) -> frozenset[str]:
@@ -3,9 +3,11 @@ from __future__ import annotations
 from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from itertools import pairwise
 from pathlib import Path
 
 from nlpo_toolkit.immutable_collections import freeze_count_mapping, freeze_mapping
+from nlpo_toolkit.worker_pool import validate_max_workers
 
 
 @dataclass(frozen=True)
@@ -38,8 +40,10 @@ class LatinWordlistBuildRequest:
     output_path: Path
     filters: WordlistFilterPolicy
     tokenization: WordlistTokenizationPolicy
+    max_workers: int = 1
 
     def __post_init__(self) -> None:
+        validate_max_workers(self.max_workers)
         object.__setattr__(self, "config_path", self.config_path.resolve())
         object.__setattr__(self, "conllu_dir", self.conllu_dir.resolve())
         object.__setattr__(self, "latin_text_dir", self.latin_text_dir.resolve())
@@ -117,7 +121,8 @@ class WordlistPublication:
 
     def __post_init__(self) -> None:
         entries = tuple(self.entries)
-        if entries != tuple(sorted(set(entries))):
+        # Strictly increasing neighbours mean sorted and unique, without re-sorting.
+        if not all(left < right for left, right in pairwise(entries)):
             raise ValueError("wordlist entries must be unique and sorted")
         object.__setattr__(self, "entries", entries)
 
@@ -15,9 +15,9 @@ from .models import (
 
 
 class ConlluCandidateCollector(Protocol):
-    def __call__(self, *, directory: Path, min_length: int) -> tuple[
-        ConlluCandidates, tuple[WordlistNotice, ...]
-    ]: ...
+    def __call__(
+        self, *, directory: Path, min_length: int, max_workers: int = 1
+    ) -> tuple[ConlluCandidates, tuple[WordlistNotice, ...]]: ...
 
 
 class TextCandidateCollector(Protocol):
@@ -27,6 +27,7 @@ class TextCandidateCollector(Protocol):
         directory: Path,
         policy: WordlistTokenizationPolicy,
         min_length: int,
+        max_workers: int = 1,
     ) -> tuple[TextCandidates, tuple[WordlistNotice, ...]]: ...
 
 
@@ -7,6 +7,8 @@ from pathlib import Path
 from .errors import LatinWordlistPublicationError
 from .models import WordlistPublication
 
+_WRITE_BATCH_SIZE = 8192
+
 
 def publish_wordlist(publication: WordlistPublication) -> None:
     output_path = publication.output_path
@@ -20,8 +22,11 @@ def publish_wordlist(publication: WordlistPublication) -> None:
         )
         temporary_path = Path(temporary_name)
         with os.fdopen(descriptor, "w", encoding="utf-8", newline="\n") as stream:
-            if publication.entries:
-                stream.write("\n".join(publication.entries) + "\n")
+            entries = publication.entries
+            # Joined in batches so the whole wordlist never exists as one string.
+            for start in range(0, len(entries), _WRITE_BATCH_SIZE):
+                batch = entries[start : start + _WRITE_BATCH_SIZE]
+                stream.write("\n".join(batch) + "\n")
             stream.flush()
             os.fsync(stream.fileno())
         os.replace(temporary_path, output_path)
@@ -16,12 +16,15 @@ def execute_latin_wordlist_build(
     dependencies: LatinWordlistDependencies,
 ) -> LatinWordlistBuildResult:
     conllu, conllu_notices = dependencies.collect_conllu(
-        directory=request.conllu_dir, min_length=request.filters.min_length
+        directory=request.conllu_dir,
+        min_length=request.filters.min_length,
+        max_workers=request.max_workers,
     )
     text, text_notices = dependencies.collect_text(
         directory=request.latin_text_dir,
         policy=request.tokenization,
         min_length=request.filters.min_length,
+        max_workers=request.max_workers,
     )
     extras = []
     notices = [*conllu_notices, *text_notices]
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Iterator
 
 __all__ = ["iter_char_chunks"]
 
+# Greedy match that backtracks to the last whitespace (``str.isspace``) in range.
+_THROUGH_LAST_WHITESPACE_RE = re.compile(r".*\s", re.DOTALL)
+
 
 def iter_char_chunks(text: str, chunk_chars: int) -> Iterator[str]:
     """Split text near the target size, preferring whitespace boundaries."""
@@ -19,9 +23,8 @@ def iter_char_chunks(text: str, chunk_chars: int) -> Iterator[str]:
         if end >= len(text):
             yield text[start:]
             break
-        while end > start and not text[end].isspace():
-            end -= 1
-        if end == start:
-            end = start + chunk_chars
+        boundary = _THROUGH_LAST_WHITESPACE_RE.match(text, start + 1, end + 1)
+        if boundary is not None:
+            end = boundary.end() - 1
         yield text[start:end]
         start = end
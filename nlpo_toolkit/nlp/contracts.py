@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from collections.abc import Mapping
-from typing import Protocol
+from collections.abc import Mapping, Sequence
+from typing import Protocol, runtime_checkable
 
 from nlpo_toolkit.immutable_collections import freeze_mapping
 
@@ -11,6 +11,7 @@ __all__ = [
     "NLPBackend",
     "NLPBackendInfo",
     "NLPBackendSpec",
+    "NLPBatchBackend",
     "NLPDocument",
     "NLPSentence",
     "NLPToken",
@@ -76,6 +77,15 @@ class NLPBackend(Protocol):
     def __call__(self, text: str) -> NLPDocument: ...
 
 
+@runtime_checkable
+class NLPBatchBackend(Protocol):
+    """Backend that can annotate several texts in one pipeline call."""
+
+    def __call__(self, text: str) -> NLPDocument: ...
+
+    def process_batch(self, texts: Sequence[str]) -> tuple[NLPDocument, ...]: ...
+
+
 @dataclass(frozen=True)
 class NLPBackendInfo:
     name: str
@@ -106,3 +116,13 @@ class NLPBackendSpec:
     stanza_package: str | None = None
     model_name: str | None = None
     use_gpu: bool = False
+    workers: int = 1
+    stanza_batch_sizes: tuple[tuple[str, int], ...] = ()
+
+    def __post_init__(self) -> None:
+        # Sorted pairs rather than a mappingproxy: the spec is pickled into workers.
+        object.__setattr__(
+            self,
+            "stanza_batch_sizes",
+            tuple(sorted(dict(self.stanza_batch_sizes).items())),
+        )
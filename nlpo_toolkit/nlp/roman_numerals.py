@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Collection
+from functools import lru_cache
 from pathlib import Path
 
 _ROMAN_NUMERAL_RE = re.compile(
@@ -56,6 +57,14 @@ def effective_roman_exceptions(
     *,
     use_lemma: bool,
     configured_exceptions: Collection[str],
+) -> frozenset[str]:
+    # Called once per token with the same policy set, so resolve it only once.
+    return _effective_roman_exceptions(use_lemma, frozenset(configured_exceptions))
+
+
+@lru_cache(maxsize=32)
+def _effective_roman_exceptions(
+    use_lemma: bool, configured_exceptions: frozenset[str]
 ) -> frozenset[str]:
     configured = normalize_roman_exceptions(configured_exceptions)
     if use_lemma:
@@ -69,10 +78,9 @@ def should_drop_roman_numeral(
     drop_roman_numerals: bool,
     effective_exceptions: Collection[str],
 ) -> bool:
+    if not drop_roman_numerals:
+        return False
     normalized_key = key.strip().lower()
-    exceptions = normalize_roman_exceptions(effective_exceptions)
-    return (
-        drop_roman_numerals
-        and _ROMAN_NUMERAL_RE.fullmatch(normalized_key) is not None
-        and normalized_key not in exceptions
-    )
+    if _ROMAN_NUMERAL_RE.fullmatch(normalized_key) is None:
+        return False
+    return normalized_key not in normalize_roman_exceptions(effective_exceptions)
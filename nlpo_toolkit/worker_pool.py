@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+
+def validate_max_workers(max_workers: object) -> None:
+    if isinstance(max_workers, bool) or not isinstance(max_workers, int):
+        raise TypeError("max_workers must be an int")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+
+def pool_chunksize(item_count: int, workers: int) -> int:
+    """Executor.map chunksize giving each worker about four chunks."""
+    return max(1, item_count // (workers * 4))
@@ -7,6 +7,7 @@ from .support.module_roles import ModuleRole, ModuleRolePolicy
 CA = "nlpo_toolkit.corpus_analysis"
 CLI = f"{CA}.cli"
 STANDALONE_CLI_MODULES = (
+    "nlpo_toolkit.cli_arguments",
     "nlpo_toolkit.latin.cleaners.run_clean_corpus",
     "nlpo_toolkit.latin.latin_wordlist.cli",
     "nlpo_toolkit.latin.latin_wordlist.__main__",
@@ -24,6 +25,7 @@ MODULE_ROLE_POLICIES: tuple[ModuleRolePolicy, ...] = (
             "nlpo_toolkit.cleaner_contracts",
             "nlpo_toolkit.config_model",
             "nlpo_toolkit.immutable_collections",
+            "nlpo_toolkit.worker_pool",
             "nlpo_toolkit.configuration",
             "nlpo_toolkit.corpus_analysis",
             "nlpo_toolkit.corpus_analysis.archive.contracts",
@@ -93,6 +95,7 @@ MODULE_ROLE_POLICIES: tuple[ModuleRolePolicy, ...] = (
             "nlpo_toolkit.latin.cleaners.events",
             "nlpo_toolkit.latin.cleaners.models",
             "nlpo_toolkit.latin.cleaners.normalization",
+            "nlpo_toolkit.latin.cleaners.prefilter",
             "nlpo_toolkit.latin.cleaners.rule_engine",
             "nlpo_toolkit.nlp.chunking",
             "nlpo_toolkit.nlp.roman_numerals",
@@ -204,6 +207,7 @@ MODULE_ROLE_POLICIES: tuple[ModuleRolePolicy, ...] = (
             "nlpo_toolkit.latin.cleaners.lexicon",
             "nlpo_toolkit.latin.cleaners.registry",
             "nlpo_toolkit.latin.cleaners.rule_loader",
+            "nlpo_toolkit.latin.cleaners.text_reader",
             "nlpo_toolkit.corpus_analysis.archive",
             "nlpo_toolkit.corpus_analysis.archive.copying",
             "nlpo_toolkit.corpus_analysis.archive.errors",
@@ -228,6 +232,7 @@ MODULE_ROLE_POLICIES: tuple[ModuleRolePolicy, ...] = (
     ModuleRolePolicy(
         ModuleRole.BOUNDARY,
         exact_modules=(
+            "nlpo_toolkit.cli_arguments",
             "nlpo_toolkit.corpus_analysis.composition",
             "nlpo_toolkit.latin.cleaners.run_clean_corpus",
             "nlpo_toolkit.latin.latin_wordlist.__main__",
@@ -4,6 +4,9 @@ from .policy import APPLICATION_MODULES, CLI, PURE_MODULES, STANDALONE_CLI_MODUL
 from .support.rules import format_violations
 from .support.source_checks import find_attribute_accesses, find_calls, find_imports
 
+# production_paths are absolute, so CLI selection must resolve against the same root.
+PRODUCTION_ROOT = Path(__file__).resolve().parents[2] / "nlpo_toolkit"
+
 
 def _paths_for_modules(production_graph, modules, root: Path):
     selected = set()
@@ -42,7 +45,7 @@ def test_application_services_have_no_terminal_api(production_graph) -> None:
 
 def test_argparse_is_limited_to_cli_adapters(production_graph, production_paths) -> None:
     cli_paths = _paths_for_modules(
-        production_graph, (CLI, *STANDALONE_CLI_MODULES), Path("nlpo_toolkit")
+        production_graph, (CLI, *STANDALONE_CLI_MODULES), PRODUCTION_ROOT
     )
     paths = tuple(path for path in production_paths if path not in set(cli_paths))
     violations = find_imports(
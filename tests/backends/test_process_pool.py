@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+from functools import partial
+
+import pytest
+
+from nlpo_toolkit.backends.process_pool import ProcessPoolNLPBackend
+from nlpo_toolkit.nlp.contracts import (
+    NLPBackendSpec,
+    NLPBatchBackend,
+    NLPDocument,
+    NLPSentence,
+)
+
+
+class _PidBackend:
+    def __call__(self, text: str) -> NLPDocument:
+        return NLPDocument(sentences=[NLPSentence(text=str(os.getpid()))], text=text)
+
+
+class _SpecBackend:
+    def __init__(self, spec: NLPBackendSpec):
+        self.spec = spec
+
+    def __call__(self, text: str) -> NLPDocument:
+        sizes = ",".join(f"{name}={size}" for name, size in self.spec.stanza_batch_sizes)
+        return NLPDocument(sentences=[NLPSentence(text=sizes)], text=text)
+
+
+def test_process_batch_annotates_in_workers_and_preserves_order() -> None:
+    backend = ProcessPoolNLPBackend(_PidBackend, max_workers=2)
+    try:
+        texts = tuple(f"chunk {index}" for index in range(6))
+        docs = backend.process_batch(texts)
+        single = backend("solus")
+    finally:
+        backend.close()
+
+    assert isinstance(backend, NLPBatchBackend)
+    assert [doc.text for doc in docs] == list(texts)
+    assert single.text == "solus"
+    assert str(os.getpid()) not in {doc.sentences[0].text for doc in docs}
+
+
+@pytest.mark.parametrize(
+    ("max_workers", "error"), [(0, ValueError), (True, TypeError), (1.5, TypeError)]
+)
+def test_invalid_worker_counts_are_rejected(max_workers: object, error: type) -> None:
+    with pytest.raises(error, match="max_workers"):
+        ProcessPoolNLPBackend(_PidBackend, max_workers=max_workers)  # type: ignore[arg-type]
+
+
+def test_backend_spec_reaches_spawned_workers() -> None:
+    spec = NLPBackendSpec(
+        backend="stanza", language="la", stanza_batch_sizes=(("pos", 50), ("lemma", 5))
+    )
+    backend = ProcessPoolNLPBackend(
+        partial(_SpecBackend, spec),
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    try:
+        docs = backend.process_batch(("arma", "virum"))
+    finally:
+        backend.close()
+
+    assert [doc.text for doc in docs] == ["arma", "virum"]
+    assert {doc.sentences[0].text for doc in docs} == {"lemma=5,pos=50"}
@@ -96,3 +96,12 @@ def test_morphology_propagates_to_included_and_excluded_records() -> None:
     )
     assert included.included is True
     assert excluded.included is False
+
+
+def test_repeated_stanza_feats_are_parsed_once_and_errors_are_not_cached() -> None:
+    assert parse_stanza_feats("Case=Abl|Number=Plur") is parse_stanza_feats(
+        "Case=Abl|Number=Plur"
+    )
+    for _ in range(2):
+        with pytest.raises(StanzaBackendDataError, match="Invalid Stanza feats"):
+            parse_stanza_feats("Case")
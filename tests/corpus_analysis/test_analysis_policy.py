@@ -21,6 +21,22 @@ def test_policy_rejects_invalid_chunk_size(chunk_chars: object) -> None:
         AnalysisExtractionPolicy(chunk_chars=chunk_chars)  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize("batch_chunks", [0, -1, True])
+def test_policy_rejects_invalid_batch_size(batch_chunks: object) -> None:
+    with pytest.raises(ValueError, match="batch_chunks must be a positive integer"):
+        AnalysisExtractionPolicy(batch_chunks=batch_chunks)  # type: ignore[arg-type]
+
+
+def test_batch_size_does_not_change_the_analysis_fingerprint() -> None:
+    info = NLPBackendInfo(name="stanza", language="la", package="perseus")
+
+    assert build_analysis_fingerprint(
+        backend_info=info, policy=AnalysisExtractionPolicy(batch_chunks=4)
+    ) == build_analysis_fingerprint(
+        backend_info=info, policy=DEFAULT_ANALYSIS_EXTRACTION_POLICY
+    )
+
+
 @pytest.mark.parametrize(
     ("processors", "message"),
     [
@@ -203,3 +203,35 @@ def test_iter_nlp_analysis_records_from_text_preserves_offsets_and_global_indice
     assert records[0].char_start_in_text == 0
     assert records[-1].token == "dd"
     assert records[-1].char_start_in_text == 9
+
+
+class _FakeBatchBackend(_FakeBackend):
+    def __init__(self) -> None:
+        self.batches: list[tuple[str, ...]] = []
+
+    def process_batch(self, texts) -> tuple[NLPDocument, ...]:
+        self.batches.append(tuple(texts))
+        return tuple(self(text) for text in texts)
+
+
+def test_batch_backend_receives_chunk_batches_with_identical_records() -> None:
+    text = "aa bb cc dd ee ff gg"
+    backend = _FakeBatchBackend()
+
+    batched = list(
+        iter_nlp_analysis_records_from_text(
+            text=text,
+            nlp=backend,
+            policy=AnalysisExtractionPolicy(chunk_chars=5, batch_chunks=2),
+        )
+    )
+    sequential = list(
+        iter_nlp_analysis_records_from_text(
+            text=text,
+            nlp=_FakeBackend(),
+            policy=AnalysisExtractionPolicy(chunk_chars=5),
+        )
+    )
+
+    assert batched == sequential
+    assert [len(batch) for batch in backend.batches] == [2, 2, 2]
@@ -5,7 +5,9 @@ from nlpo_toolkit.corpus_analysis.corpus import PreparedCorpus
 from nlpo_toolkit.corpus_analysis.analysis_policy import AnalysisExtractionPolicy
 from collections import Counter
 
+import pickle
 import sys
+from multiprocessing.reduction import ForkingPickler
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -14,6 +16,7 @@ from pydantic import ValidationError
 
 import nlpo_toolkit.corpus_analysis.runner as runner_mod
 from nlpo_toolkit.backends import (
+    NLPBackendConfigError,
     TransformersBackend as PublicTransformersBackend,
     create_nlp_backend,
 )
@@ -126,6 +129,7 @@ def test_factory_selects_stanza_without_transformers(monkeypatch: pytest.MonkeyP
             "package": "perseus",
             "use_gpu": False,
             "processors": "tokenize,mwt,pos,lemma",
+            "batch_sizes": {},
         }
     ]
     assert built.info == NLPBackendInfo(
@@ -136,6 +140,79 @@ def test_factory_selects_stanza_without_transformers(monkeypatch: pytest.MonkeyP
     )
 
 
+def test_factory_defers_backend_construction_to_worker_processes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import nlpo_toolkit.backends.stanza_backend as stanza_mod
+    from nlpo_toolkit.backends.process_pool import ProcessPoolNLPBackend
+
+    def fail_in_parent(**_kwargs):
+        raise AssertionError("the parent process must not load a model")
+
+    monkeypatch.setattr(stanza_mod, "StanzaBackend", fail_in_parent)
+
+    built = create_nlp_backend(
+        NLPBackendSpec(backend="stanza", language="la", workers=3),
+        processors=("tokenize", "pos"),
+    )
+
+    assert isinstance(built.backend, ProcessPoolNLPBackend)
+    assert built.backend.max_workers == 3
+    assert built.info == NLPBackendInfo(name="stanza", language="la", package="perseus")
+
+
+def test_stanza_batch_sizes_are_forwarded_per_processor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[dict[str, object]] = []
+    fake_stanza = SimpleNamespace(
+        Pipeline=lambda **kwargs: calls.append(kwargs), Document=object
+    )
+    monkeypatch.setitem(sys.modules, "stanza", fake_stanza)
+
+    config = NLPConfig(stanza_batch_sizes={"pos": 5000, "lemma": 500})
+    create_nlp_backend(
+        NLPBackendSpec(
+            backend="stanza",
+            language="la",
+            stanza_batch_sizes=tuple(config.stanza_batch_sizes.items()),
+        ),
+        processors=("tokenize", "pos", "lemma"),
+    )
+
+    assert calls[0]["pos_batch_size"] == 5000
+    assert calls[0]["lemma_batch_size"] == 500
+    assert "tokenize_batch_size" not in calls[0]
+
+
+def test_factory_rejects_batch_sizes_for_disabled_processors() -> None:
+    with pytest.raises(NLPBackendConfigError, match="not enabled: depparse"):
+        create_nlp_backend(
+            NLPBackendSpec(
+                backend="stanza", language="la", stanza_batch_sizes=(("depparse", 10),)
+            ),
+            processors=("tokenize", "pos"),
+        )
+
+
+def test_worker_backend_factory_survives_a_spawn_round_trip() -> None:
+    built = create_nlp_backend(
+        NLPBackendSpec(
+            backend="stanza",
+            language="la",
+            workers=2,
+            stanza_batch_sizes=(("pos", 500),),
+        ),
+        processors=("tokenize", "pos"),
+    )
+    factory = built.backend.factory
+
+    restored = pickle.loads(ForkingPickler.dumps(factory))
+
+    assert restored.func is factory.func
+    assert restored.args == factory.args
+
+
 def test_factory_selects_transformers_without_stanza(monkeypatch: pytest.MonkeyPatch) -> None:
     calls: list[str] = []
 
@@ -174,6 +251,12 @@ def test_factory_rejects_transformers_without_model_name() -> None:
         NLPConfig(backend="transformers", language="la")
 
 
+@pytest.mark.parametrize("workers", [0, True, "2"])
+def test_config_rejects_invalid_worker_count(workers: object) -> None:
+    with pytest.raises(ValidationError, match="workers"):
+        NLPConfig(workers=workers)
+
+
 def test_config_rejects_transformers_without_model_name(tmp_path: Path) -> None:
     cfg = tmp_path / "cfg.yml"
     cfg.write_text(
@@ -132,3 +132,19 @@ def test_diagnostic_trace_writes_missing_offsets_as_empty_fields(tmp_path: Path)
     row = _rows(path)[1]
     assert row[4] == ""
     assert row[5] == ""
+
+
+def test_diagnostic_trace_flushes_batched_rows_in_order(tmp_path: Path) -> None:
+    path = tmp_path / "trace.tsv"
+    count = 4096 + 3
+    try:
+        with DiagnosticTraceWriter(path) as writer:
+            for index in range(count):
+                writer.consider(_record(token_index=index))
+            raise RuntimeError("analysis failed")
+    except RuntimeError:
+        pass
+
+    rows = _rows(path)
+    assert [int(row[3]) for row in rows[1:]] == list(range(count))
+    assert rows[-1][-1] == str(count)
@@ -71,3 +71,24 @@ def test_nlp_session_keeps_built_backend_whole(tmp_path: Path) -> None:
     assert session.extraction_policy is policy
     assert session.roman_exceptions == frozenset()
     assert len(calls) == 1
+
+
+def test_nlp_session_batches_chunks_from_config(tmp_path: Path) -> None:
+    (tmp_path / "input.txt").write_text("Rosa", encoding="utf-8")
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(
+        "groups:\n  text: {files: [input.txt]}\nnlp: {batch_chunks: 8}\n",
+        encoding="utf-8",
+    )
+    corpus = prepare_analysis_corpus_session(
+        CorpusPreparationRequest(tmp_path, config_path),
+        dependencies=_corpus_dependencies(),
+    )
+    policy = AnalysisExtractionPolicy(chunk_chars=123)
+    session = start_nlp_execution_session(
+        corpus,
+        dependencies=NLPExecutionDependencies(fake_backend_factory(), policy),
+    )
+    assert session.extraction_policy == AnalysisExtractionPolicy(
+        chunk_chars=123, batch_chunks=8
+    )
@@ -11,6 +11,8 @@ from nlpo_toolkit.corpus_analysis.normalizer import normalize_text
         (NormalizationConfig(unicode_nf="NFKD"), "ﬃ", "ffi"),
         (NormalizationConfig(normalize_ligatures=True), "æneas œ", "aeneas oe"),
         (NormalizationConfig(strip_diacritics=True), "múltās", "multas"),
+        (NormalizationConfig(strip_diacritics=True), "Gallia est", "Gallia est"),
+        (NormalizationConfig(strip_diacritics=True), "\u1e17 \u0301x ǖ", "e x u"),
         (NormalizationConfig(map_u_v=True), "Vivit", "Uiuit"),
         (NormalizationConfig(map_i_j=True), "Julius", "Iulius"),
         (NormalizationConfig(casefold=True), "ÆNEAS", "æneas"),
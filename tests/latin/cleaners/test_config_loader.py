@@ -12,6 +12,7 @@ from nlpo_toolkit.cleaner_contracts import (
 from nlpo_toolkit.latin.cleaners.config_loader import (
     inspect_cleaner_config,
     load_cleaner_config,
+    resolve_cleaner_input_files,
 )
 
 
@@ -106,3 +107,16 @@ def test_cleaner_config_rejects_duplicate_keys(
         load_cleaner_config(path)
     assert "Duplicate YAML key" in str(caught.value)
     assert str(path.resolve()) in str(caught.value)
+
+
+def test_directory_input_lists_sorted_txt_files_and_resolves_links(tmp_path: Path) -> None:
+    source = tmp_path / "input"
+    (source / "nested.txt").mkdir(parents=True)
+    for name in ("b.txt", "a.TXT", "c.md", ".txt"):
+        (source / name).write_text("x", encoding="utf-8")
+    target = tmp_path / "target.txt"
+    target.write_text("x", encoding="utf-8")
+    (source / "link.txt").symlink_to(target)
+    (source / "dangling.txt").symlink_to(tmp_path / "missing.txt")
+    resolved = source.resolve()
+    assert resolve_cleaner_input_files(source) == (resolved / "a.TXT", resolved / "b.txt", target.resolve())
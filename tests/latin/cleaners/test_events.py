@@ -1,6 +1,8 @@
 from pathlib import Path
 
-from nlpo_toolkit.latin.cleaners.events import write_ref_events
+import pytest
+
+from nlpo_toolkit.latin.cleaners.events import RefEventSink, write_ref_events
 from nlpo_toolkit.latin.cleaners.models import RefEvent, RuleReference
 
 
@@ -12,3 +14,30 @@ def test_events_writer_preserves_schema_and_replaces_previous_run(tmp_path: Path
     lines = path.read_text(encoding="utf-8").splitlines()
     assert lines[0].split("\t") == ["doc_id", "kind", "rule_name", "action", "line_no", "match_count", "ref_key", "ref_author", "ref_work", "ref_loc", "text_snippet"]
     assert len(lines) == 2
+
+
+def test_event_sink_streams_batches_and_keeps_previous_file_on_failure(tmp_path: Path) -> None:
+    path = tmp_path / "events.tsv"
+    event = RefEvent("d", "scholastic_text", "r", "drop_line", 1, 1, RuleReference(), "x")
+    write_ref_events(path, (event,))
+    previous = path.read_text(encoding="utf-8")
+
+    with pytest.raises(LookupError), RefEventSink(path) as sink:
+        sink.extend((event, event))
+        raise LookupError("stop")
+    assert path.read_text(encoding="utf-8") == previous
+    assert not path.with_name("events.tsv.tmp").exists()
+
+    with RefEventSink(path) as sink:
+        sink.extend((event,))
+        sink.extend(iter((event, event)))
+    assert sink.event_count == 3
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 4
+
+
+def test_event_sink_matches_csv_quoting_for_plain_and_special_fields(tmp_path: Path) -> None:
+    path = tmp_path / "events.tsv"
+    plain = RefEvent("d", "scholastic_text", "r", "drop_line", 1, 1, RuleReference(), "a b")
+    special = RefEvent("d", "scholastic_text", "r", "substitute", 2, 1, RuleReference(), 'a\t"b"\r\nc')
+    write_ref_events(path, (plain, special))
+    assert path.read_bytes().split(b"\r\n", 1)[1] == b'd\tscholastic_text\tr\tdrop_line\t1\t1\t\t\t\t\ta b\r\nd\tscholastic_text\tr\tsubstitute\t2\t1\t\t\t\t\t"a\t""b""\r\nc"\r\n'
@@ -1,7 +1,9 @@
+import re
 from pathlib import Path
 
 import pytest
 
+from nlpo_toolkit.latin.cleaners import lexicon
 from nlpo_toolkit.latin.cleaners.errors import CleanerLexiconError
 from nlpo_toolkit.latin.cleaners.lexicon import apply_lexicon_map, load_lexicon_map
 
@@ -20,3 +22,30 @@ def test_lexicon_bad_row_reports_path_and_line(tmp_path: Path) -> None:
     path.write_text("valid\trow\nbad\n", encoding="utf-8")
     with pytest.raises(CleanerLexiconError, match=r"bad\.tsv:2"):
         load_lexicon_map(path)
+
+
+def test_lexicon_load_is_cached_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.tsv"
+    path.write_text("foo\tbar\n", encoding="utf-8")
+    first = load_lexicon_map(path)
+    assert load_lexicon_map(path) is first
+
+    path.write_text("foo\tbaz\nqux\tquux\n", encoding="utf-8")
+    assert load_lexicon_map(path) == {"foo": "baz", "qux": "quux"}
+
+
+def test_large_word_lexicon_matches_keyword_alternation() -> None:
+    mapping = {f"w{index}": f"r{index}" for index in range(40)} | {"caelum": "coelum", "w1_x": "joined"}
+    text = "w1 w12 w1_x w400 xw1 w1x caelum, caelumque\nw39.w3 æw2"
+    expected = re.compile(r"\b(" + "|".join(re.escape(key) for key in sorted(mapping, key=len, reverse=True)) + r")\b")
+    assert apply_lexicon_map(text, mapping) == expected.sub(lambda match: mapping[match.group(1)], text)
+    assert apply_lexicon_map(text, mapping) == "r1 r12 joined w400 xw1 w1x coelum, caelumque\nr39.r3 æw2"
+
+
+def test_lexicon_alternation_is_compiled_once_per_key_set() -> None:
+    lexicon._compile_lexicon_keys.cache_clear()
+
+    assert apply_lexicon_map("a ab", {"a": "x", "ab": "y"}) == "x y"
+    assert apply_lexicon_map("ab a", {"ab": "z", "a": "x"}) == "z x"
+    info = lexicon._compile_lexicon_keys.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
@@ -0,0 +1,11 @@
+from nlpo_toolkit.latin.cleaners.normalization import normalize_cleaned_text
+
+
+def test_normalization_matches_joined_text_collapse_and_strip() -> None:
+    lines = ["", " \t", "  first   line ", "", "", "", "\t", "second\n\n\n\nthird  ", " ", ""]
+    assert normalize_cleaned_text(lines) == "first line \n\n\t\nsecond\n\nthird\n"
+
+
+def test_normalization_consumes_an_iterator_and_handles_blank_input() -> None:
+    assert normalize_cleaned_text(iter(["a", "", "", "b"])) == "a\n\nb\n"
+    assert normalize_cleaned_text(iter(["", " ", "\t"])) == "\n"
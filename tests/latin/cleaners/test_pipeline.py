@@ -3,11 +3,12 @@ from pathlib import Path
 from types import MappingProxyType
 
 from nlpo_toolkit.latin.cleaners.models import CleanerProfile, LineRemoveRule, RuleSet, SubstituteRule
-from nlpo_toolkit.latin.cleaners.pipeline import clean_document
+from nlpo_toolkit.latin.cleaners.corpora import corpus_corporum
+from nlpo_toolkit.latin.cleaners.pipeline import clean_document, clean_file
 
 
 def test_pipeline_orders_profile_rules_normalization_and_lexicon() -> None:
-    profile = CleanerProfile("scholastic_text", Path("rules"), lambda text: tuple(text.splitlines()[1:]), lambda line: line)
+    profile = CleanerProfile("scholastic_text", Path("rules"), lambda line: line, lambda lines: tuple(lines)[1:])
     rules = RuleSet(
         (LineRemoveRule(re.compile("DROP"), name="drop"),),
         (SubstituteRule(re.compile("foo"), "bar", name="sub"),),
@@ -19,5 +20,17 @@ def test_pipeline_orders_profile_rules_normalization_and_lexicon() -> None:
 
 
 def test_pipeline_empty_input_returns_one_newline() -> None:
-    profile = CleanerProfile("scholastic_text", Path("rules"), lambda text: tuple(text.splitlines()), lambda line: line)
+    profile = CleanerProfile("scholastic_text", Path("rules"), lambda line: line)
     assert clean_document("", profile=profile, rules=RuleSet(), lexicon_map=MappingProxyType({})).text == "\n"
+
+
+def test_clean_file_matches_clean_document(tmp_path: Path) -> None:
+    text = "meta\r\n#####\r\nDROP\r\nfoo\tfoo\r\n\r\n\r\n\r\nend"
+    path = tmp_path / "input.txt"
+    path.write_bytes(text.encode("utf-8"))
+    rules = RuleSet(
+        (LineRemoveRule(re.compile("DROP"), name="drop"),),
+        (SubstituteRule(re.compile("foo"), "bar", name="sub"),),
+    )
+    options = {"profile": corpus_corporum.PROFILE, "rules": rules, "lexicon_map": MappingProxyType({}), "doc_id": "d"}
+    assert clean_file(path, **options) == clean_document(path.read_text(encoding="utf-8"), **options)
@@ -0,0 +1,31 @@
+import re
+
+import pytest
+
+from nlpo_toolkit.latin.cleaners.models import SubstituteRule
+from nlpo_toolkit.latin.cleaners.prefilter import required_literal
+
+
+@pytest.mark.parametrize(
+    "pattern, literal",
+    [
+        (r"\bRom\.(?=\s|$|,|;|:)", "Rom."),
+        (r"^Sed\s+contra\.?\s*$", "contra"),
+        (r"\[\s*CAPUT\s+[IVXLCDM]+\.\s*\]", "CAPUT"),
+        (r"abcd?", "abc"),
+        (r"abc+d", "abc"),
+        (r"\x41bcd", "bcd"),
+        (r"[abc]de", ""),
+        (r"abc|def", ""),
+        (r"(?i)abcdef", ""),
+        (r"abcd(?#note)*", ""),
+        (r"ab{1,2}cd", ""),
+    ],
+)
+def test_required_literal_is_conservative(pattern: str, literal: str) -> None:
+    assert required_literal(re.compile(pattern)) == literal
+
+
+def test_rules_carry_their_prefilter() -> None:
+    assert SubstituteRule(re.compile(r"\bMetaphys\."), "REF").required_literal == "Metaphys."
+    assert SubstituteRule(re.compile(r"\[\d+\]"), "").required_literal == ""
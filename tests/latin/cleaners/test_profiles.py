@@ -1,16 +1,47 @@
+import pytest
+
 from nlpo_toolkit.latin.cleaners.corpora import corpus_corporum, scholastic
+from nlpo_toolkit.latin.cleaners.rule_loader import load_rule_set
+
+
+def _corpus_corporum_lines(text: str) -> tuple[str, ...]:
+    return tuple(corpus_corporum.select_lines(text.splitlines()))
 
 
 def test_corpus_corporum_profile_owns_header_and_tab_behavior() -> None:
-    assert corpus_corporum.prepare_lines("meta\n  #####  \nbody\n######\nlater") == ("body", "######", "later")
-    assert corpus_corporum.prepare_lines("####\nbody") == ("####", "body")
+    assert _corpus_corporum_lines("meta\n  #####  \nbody\n######\nlater") == ("body", "######", "later")
+    assert _corpus_corporum_lines("####\nbody") == ("####", "body")
     assert corpus_corporum.finalize_line("a\tb") == "a b"
     assert corpus_corporum.PROFILE.kind == "corpus_corporum"
     assert corpus_corporum.DEFAULT_RULES_PATH.name == "corpus_corporum.yml"
 
 
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("#####", ()),
+        ("meta\r\n#####\r\nbody\r\n", ("body",)),
+        ("meta\r#####\rbody", ("body",)),
+        ("meta\u2028 ##### \x0cbody", ("body",)),
+        ("meta ##### \nbody", ("meta ##### ", "body")),
+        ("\n\n#####\n\nbody", ("", "body")),
+    ],
+)
+def test_corpus_corporum_header_scan_follows_splitlines_boundaries(text: str, expected: tuple[str, ...]) -> None:
+    assert _corpus_corporum_lines(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("line", "removed"),
+    [("12: 3, 4.", True), ("1:  ", True), ("1:x", False), ("1: see p. 4", False), ("1:" + " " * 50_000 + "a", False)],
+)
+def test_corpus_corporum_footnote_rule_matches_in_linear_time(line: str, removed: bool) -> None:
+    rules = {rule.name: rule for rule in load_rule_set(corpus_corporum.DEFAULT_RULES_PATH).remove_lines}
+    assert bool(rules["footnote_line"].pattern.match(line)) is removed
+
+
 def test_scholastic_profile_keeps_headers_and_tabs() -> None:
-    assert scholastic.prepare_lines("#####\na\tb") == ("#####", "a\tb")
     assert scholastic.finalize_line("a\tb") == "a\tb"
+    assert tuple(scholastic.PROFILE.select_lines(iter(("#####", "a")))) == ("#####", "a")
     assert scholastic.PROFILE.kind == "scholastic_text"
     assert scholastic.DEFAULT_RULES_PATH.name == "scholastic_text.yml"
@@ -1,7 +1,7 @@
 import re
 
 from nlpo_toolkit.latin.cleaners.models import LineRemoveRule, RuleReference, RuleSet, SubstituteRule
-from nlpo_toolkit.latin.cleaners.rule_engine import apply_rule_set
+from nlpo_toolkit.latin.cleaners.rule_engine import apply_rule_set, iter_rule_set
 
 
 def test_rule_engine_removes_then_substitutes_in_order_and_emits_events() -> None:
@@ -22,3 +22,47 @@ def test_rule_engine_removes_then_substitutes_in_order_and_emits_events() -> Non
     ]
     assert result.events[1].text_snippet == "foo "
     assert lines == ("  DROP this  ", "foo foo")
+
+
+def test_fused_remove_rules_report_the_first_matching_rule() -> None:
+    rules = RuleSet(
+        remove_lines=(
+            LineRemoveRule(re.compile(r"(Quaestio)\s+(\d+)$"), name="quaestio"),
+            LineRemoveRule(re.compile(r"Q"), name="any_q"),
+            LineRemoveRule(re.compile(r"(?P<word>Ad)\s"), name="ad"),
+        ),
+    )
+    assert rules.fused_remove_lines is not None
+    result = apply_rule_set(("Quaestio 3", "Quaestio tertia", "Ad primum", "keep"), rules=rules, kind="scholastic_text")
+    assert result.lines == ("keep",)
+    assert [event.rule_name for event in result.events] == ["quaestio", "any_q", "ad"]
+
+
+def test_remove_rules_with_backreferences_or_flags_are_not_fused() -> None:
+    backreference = RuleSet(
+        remove_lines=(LineRemoveRule(re.compile(r"(\w)\1"), name="double"), LineRemoveRule(re.compile("x"), name="x")),
+    )
+    flagged = RuleSet(
+        remove_lines=(LineRemoveRule(re.compile("drop", re.IGNORECASE), name="drop"), LineRemoveRule(re.compile("x"), name="x")),
+    )
+    assert backreference.fused_remove_lines is None
+    assert flagged.fused_remove_lines is None
+    assert apply_rule_set(("aab", "ab"), rules=backreference, kind="scholastic_text").lines == ("ab",)
+    assert apply_rule_set(("DROP", "keep"), rules=flagged, kind="scholastic_text").lines == ("keep",)
+
+
+def test_iter_rule_set_records_events_as_lines_are_consumed() -> None:
+    rules = RuleSet(substitutions=(SubstituteRule(re.compile("a"), "b", name="a_to_b"),))
+    events: list = []
+    lines = iter_rule_set(iter(("a", "c", "aa")), rules=rules, kind="scholastic_text", events=events)
+    assert next(lines) == "b"
+    assert [event.line_number for event in events] == [1]
+    assert list(lines) == ["c", "bb"]
+    assert [(event.line_number, event.match_count) for event in events] == [(1, 1), (3, 2)]
+
+
+def test_prefiltered_substitutions_still_apply_and_report_counts() -> None:
+    rules = RuleSet(substitutions=(SubstituteRule(re.compile(r"\bRom\.(?=\s|$)"), "REF", name="rom"),))
+    result = apply_rule_set(("Rom. 1 Rom.", "Roma", "nothing"), rules=rules, kind="scholastic_text")
+    assert result.lines == ("REF 1 REF", "Roma", "nothing")
+    assert [(event.line_number, event.match_count) for event in result.events] == [(1, 2)]
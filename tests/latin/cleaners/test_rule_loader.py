@@ -55,3 +55,15 @@ def test_rule_yaml_rejects_duplicate_sections_and_rule_fields(
     path.write_text(text, encoding="utf-8")
     with pytest.raises(CleanerRuleConfigError, match="Duplicate YAML key"):
         load_rule_set(path)
+
+
+def test_load_rule_set_reuses_compiled_rules_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "rules.yml"
+    path.write_text("remove_line_patterns: [{pattern: '^DROP'}]\n", encoding="utf-8")
+    first = load_rule_set(path)
+    assert load_rule_set(tmp_path / "." / "rules.yml") is first
+
+    path.write_text("remove_line_patterns: [{pattern: '^SKIP|^DROP'}]\n", encoding="utf-8")
+    changed = load_rule_set(path)
+    assert changed is not first
+    assert changed.remove_lines[0].pattern.pattern == "^SKIP|^DROP"
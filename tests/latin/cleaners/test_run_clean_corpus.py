@@ -7,6 +7,7 @@ from nlpo_toolkit.cleaner_contracts import (
     CleanerApplicationError,
     CleanerConfig,
     CleanerConfigInspection,
+    CleanerExecutionRequest,
     CleanerExecutionResult,
 )
 
@@ -16,18 +17,23 @@ def _inspection(path: Path) -> CleanerConfigInspection:
     return CleanerConfigInspection(config, (config.input_path,), ())
 
 
-def test_cli_builds_typed_request_and_presents_result(tmp_path, monkeypatch, capsys) -> None:
+@pytest.fixture
+def recorded_requests(tmp_path, monkeypatch) -> list[CleanerExecutionRequest]:
+    """Route the CLI to a fixed inspection and record the requests it executes."""
     config_path = tmp_path / "cleaner.yml"
     inspection = _inspection(config_path)
     result = CleanerExecutionResult(
         config_path, "scholastic_text", tmp_path / "out", (), tmp_path / "events.tsv"
     )
-    calls = []
+    calls: list[CleanerExecutionRequest] = []
     monkeypatch.setattr(cli, "inspect_cleaner_config", lambda path: inspection)
     monkeypatch.setattr(cli, "execute_cleaner", lambda request: calls.append(request) or result)
+    return calls
 
-    assert cli.main([str(config_path)]) == 0
-    assert calls[0].inspection is inspection
+
+def test_cli_builds_typed_request_and_presents_result(tmp_path, recorded_requests, capsys) -> None:
+    assert cli.main([str(tmp_path / "cleaner.yml")]) == 0
+    assert recorded_requests[0].inspection is cli.inspect_cleaner_config(tmp_path / "cleaner.yml")
     output = capsys.readouterr().out
     assert "scholastic_text" in output
     assert "events.tsv" in output
@@ -45,3 +51,12 @@ def test_cli_rejects_extra_arguments() -> None:
     with pytest.raises(SystemExit) as caught:
         cli.main(["one.yml", "two.yml"])
     assert caught.value.code == 2
+
+
+def test_cli_passes_worker_count_and_rejects_non_positive_values(tmp_path, recorded_requests) -> None:
+    config_path = tmp_path / "cleaner.yml"
+    assert cli.main([str(config_path), "--workers", "3"]) == 0
+    assert recorded_requests[0].max_workers == 3
+    with pytest.raises(SystemExit) as caught:
+        cli.main([str(config_path), "--workers", "0"])
+    assert caught.value.code == 2
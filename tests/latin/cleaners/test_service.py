@@ -27,7 +27,7 @@ from nlpo_toolkit.latin.cleaners.models import (
 
 
 def _program(kind="scholastic_text") -> CleanerProgram:
-    profile = CleanerProfile(kind, Path("rules.yml"), lambda text: tuple(text.splitlines()), lambda line: line)
+    profile = CleanerProfile(kind, Path("rules.yml"), lambda line: line)
     return CleanerProgram(profile, RuleSet(), MappingProxyType({}))
 
 
@@ -65,7 +65,7 @@ def test_single_file_uses_inspection_and_returns_typed_result(tmp_path, monkeypa
     inspection = _inspection(tmp_path, output=tmp_path / "result.txt")
     loads = []
     monkeypatch.setattr(service, "load_cleaner_program", lambda **kwargs: loads.append(kwargs) or _program())
-    monkeypatch.setattr(service, "clean_document", lambda raw, **kwargs: CleaningResult(raw.upper(), ()))
+    monkeypatch.setattr(service, "clean_file", lambda path, **kwargs: CleaningResult(path.read_text(encoding="utf-8").upper(), ()))
 
     result = service.execute_cleaner(CleanerExecutionRequest(inspection))
 
@@ -83,11 +83,11 @@ def test_directory_template_is_always_respected_and_program_built_once(tmp_path,
     docs = []
     monkeypatch.setattr(service, "load_cleaner_program", lambda **kwargs: loads.append(kwargs) or _program())
 
-    def clean(raw, **kwargs):
+    def clean(path, **kwargs):
         docs.append(kwargs["doc_id"])
-        return CleaningResult(raw.upper(), ())
+        return CleaningResult(path.read_text(encoding="utf-8").upper(), ())
 
-    monkeypatch.setattr(service, "clean_document", clean)
+    monkeypatch.setattr(service, "clean_file", clean)
     result = service.execute_cleaner(CleanerExecutionRequest(inspection))
 
     assert len(loads) == 1
@@ -105,7 +105,7 @@ def test_invalid_or_colliding_directory_plan_fails_before_cleaning(tmp_path, mon
         nonlocal called
         called = True
 
-    monkeypatch.setattr(service, "clean_document", clean)
+    monkeypatch.setattr(service, "clean_file", clean)
     expected = CleanerOutputPlanError if template == "same.txt" else CleanerTemplateError
     with pytest.raises(expected):
         service.execute_cleaner(CleanerExecutionRequest(inspection))
@@ -135,11 +135,12 @@ def test_events_are_aggregated_and_replaced_for_each_run(tmp_path, monkeypatch)
     inspection = _inspection(tmp_path, directory=True, ref_tsv=event_path)
     monkeypatch.setattr(service, "load_cleaner_program", lambda **kwargs: _program())
 
-    def clean(raw, **kwargs):
+    def clean(path, **kwargs):
+        raw = path.read_text(encoding="utf-8")
         event = RefEvent(kwargs["doc_id"], "scholastic_text", "rule", "substitute", 1, 1, RuleReference(), raw)
         return CleaningResult(raw, (event,))
 
-    monkeypatch.setattr(service, "clean_document", clean)
+    monkeypatch.setattr(service, "clean_file", clean)
     result = service.execute_cleaner(CleanerExecutionRequest(inspection))
     assert result.reference_event_count == 2
     assert len(event_path.read_text(encoding="utf-8").splitlines()) == 3
@@ -163,7 +164,7 @@ def test_pipeline_failure_is_typed_and_preserves_cause(tmp_path, monkeypatch) ->
     inspection = _inspection(tmp_path)
     failure = LookupError("pipeline")
     monkeypatch.setattr(service, "load_cleaner_program", lambda **kwargs: _program())
-    monkeypatch.setattr(service, "clean_document", lambda *args, **kwargs: (_ for _ in ()).throw(failure))
+    monkeypatch.setattr(service, "clean_file", lambda *args, **kwargs: (_ for _ in ()).throw(failure))
     with pytest.raises(CleanerExecutionError) as caught:
         service.execute_cleaner(CleanerExecutionRequest(inspection))
     assert caught.value.__cause__ is failure
@@ -173,8 +174,68 @@ def test_event_write_failure_is_typed_and_preserves_cause(tmp_path, monkeypatch)
     inspection = _inspection(tmp_path, ref_tsv=tmp_path / "events.tsv")
     failure = OSError("disk full")
     monkeypatch.setattr(service, "load_cleaner_program", lambda **kwargs: _program())
-    monkeypatch.setattr(service, "clean_document", lambda raw, **kwargs: CleaningResult(raw, ()))
-    monkeypatch.setattr(service, "write_ref_events", lambda path, events: (_ for _ in ()).throw(failure))
+    monkeypatch.setattr(service, "clean_file", lambda path, **kwargs: CleaningResult("", ()))
+
+    class FailingSink:
+        def __init__(self, path):
+            pass
+
+        def __enter__(self):
+            raise failure
+
+        def __exit__(self, *exc_info):
+            return None
+
+    monkeypatch.setattr(service, "RefEventSink", FailingSink)
     with pytest.raises(CleanerOutputWriteError) as caught:
         service.execute_cleaner(CleanerExecutionRequest(inspection))
     assert caught.value.__cause__ is failure
+
+
+def test_worker_processes_match_sequential_output_and_event_order(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    for name in ("c", "a", "b"):
+        (source / f"{name}.txt").write_text(f"Quaestio 1\n{name} [1] text\n", encoding="utf-8")
+    files = tuple(sorted(path.resolve() for path in source.glob("*.txt")))
+
+    def run(output: str, max_workers: int) -> tuple[list[str], str]:
+        config = CleanerConfig(
+            (tmp_path / "cleaner.yml").resolve(),
+            "scholastic_text",
+            source.resolve(),
+            (tmp_path / output).resolve(),
+            ref_tsv_path=(tmp_path / f"{output}.tsv").resolve(),
+        )
+        inspection = CleanerConfigInspection(config, files, ())
+        result = service.execute_cleaner(CleanerExecutionRequest(inspection, max_workers=max_workers))
+        texts = [path.read_text(encoding="utf-8") for path in result.output_files]
+        return texts, (tmp_path / f"{output}.tsv").read_text(encoding="utf-8")
+
+    sequential = run("sequential", 1)
+    assert run("parallel", 2) == sequential
+    assert sequential[0] == ["a text\n", "b text\n", "c text\n"]
+
+
+@pytest.mark.parametrize("max_workers, error", [(0, ValueError), (True, TypeError)])
+def test_request_rejects_invalid_worker_counts(tmp_path, max_workers, error) -> None:
+    with pytest.raises(error):
+        CleanerExecutionRequest(_inspection(tmp_path), max_workers=max_workers)
+
+
+def test_worker_failure_stops_cleaning_queued_files(tmp_path) -> None:
+    source = tmp_path / "input"
+    source.mkdir()
+    (source / "000.txt").write_bytes(b"\xff")
+    for index in range(1, 200):
+        (source / f"{index:03}.txt").write_text("Quaestio 1\ntext [1]\n" * 200, encoding="utf-8")
+    files = tuple(sorted(path.resolve() for path in source.glob("*.txt")))
+    output = (tmp_path / "cleaned").resolve()
+    config = CleanerConfig((tmp_path / "cleaner.yml").resolve(), "scholastic_text", source.resolve(), output)
+    inspection = CleanerConfigInspection(config, files, ())
+
+    with pytest.raises(CleanerInputReadError):
+        service.execute_cleaner(CleanerExecutionRequest(inspection, max_workers=2))
+
+    assert not (output / "199.txt").exists()
+    assert len(list(output.glob("*.txt"))) < 20
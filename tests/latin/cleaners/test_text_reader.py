@@ -0,0 +1,21 @@
+from pathlib import Path
+
+import pytest
+
+from nlpo_toolkit.latin.cleaners.errors import CleanerInputReadError
+from nlpo_toolkit.latin.cleaners.text_reader import iter_text_lines
+
+
+@pytest.mark.parametrize("text", ["", "\n", "one", "a\r\nb\rc\n\nd\x0be f\n", "﻿é\r\n\r\n"])
+def test_text_lines_match_read_text_splitlines(tmp_path: Path, text: str) -> None:
+    path = tmp_path / "input.txt"
+    path.write_bytes(text.encode("utf-8"))
+    assert list(iter_text_lines(path)) == path.read_text(encoding="utf-8").splitlines()
+
+
+def test_text_lines_report_invalid_utf8_with_path(tmp_path: Path) -> None:
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"valid\n\xff\n")
+    with pytest.raises(CleanerInputReadError, match=r"input\.txt") as caught:
+        list(iter_text_lines(path))
+    assert isinstance(caught.value.__cause__, UnicodeDecodeError)
@@ -16,6 +16,8 @@ from nlpo_toolkit.latin.latin_wordlist.models import (
 def test_parse_args_accepts_config_and_has_packaged_default() -> None:
     assert cli.parse_args(["--config", "custom.yml"]).config == Path("custom.yml")
     assert cli.parse_args([]).config == cli.DEFAULT_CONFIG_PATH
+    assert cli.parse_args([]).workers == 1
+    assert cli.parse_args(["--workers", "3"]).workers == 3
 
 
 def test_cli_success_renders_statistics_and_notices(monkeypatch, capsys) -> None:
@@ -31,7 +33,7 @@ def test_cli_success_renders_statistics_and_notices(monkeypatch, capsys) -> None
             ),
         ),
     )
-    monkeypatch.setattr(cli, "load_wordlist_build_request", lambda path: object())
+    monkeypatch.setattr(cli, "load_wordlist_build_request", lambda path, **kwargs: object())
     monkeypatch.setattr(cli, "default_latin_wordlist_dependencies", lambda: object())
     monkeypatch.setattr(cli, "execute_latin_wordlist_build", lambda *args, **kwargs: result)
     assert cli.run_cli(["--config", "config.yml"]) == 0
@@ -42,14 +44,14 @@ def test_cli_success_renders_statistics_and_notices(monkeypatch, capsys) -> None
 
 
 def test_cli_maps_config_and_execution_errors(monkeypatch, capsys) -> None:
-    def bad_config(path):
+    def bad_config(path, **kwargs):
         raise LatinWordlistConfigError("bad config")
 
     monkeypatch.setattr(cli, "load_wordlist_build_request", bad_config)
     assert cli.run_cli([]) == 2
     assert "bad config" in capsys.readouterr().err
 
-    monkeypatch.setattr(cli, "load_wordlist_build_request", lambda path: object())
+    monkeypatch.setattr(cli, "load_wordlist_build_request", lambda path, **kwargs: object())
     monkeypatch.setattr(cli, "default_latin_wordlist_dependencies", lambda: object())
 
     def bad_source(*args, **kwargs):
@@ -72,6 +72,17 @@ def test_invalid_utf8_is_a_typed_read_error(tmp_path: Path) -> None:
         )
 
 
+def test_extra_wordlist_is_streamed_with_splitlines_boundaries_and_strict_utf8(tmp_path: Path) -> None:
+    path = tmp_path / "extra.txt"
+    path.write_bytes("amo\r\nRosa\x85homo\u2028via\n".encode("utf-8"))
+    extra, _ = collect_extra_wordlist_candidates(path=path)
+    assert extra is not None and extra.entries == {"amo", "rosa", "homo", "via"}
+
+    path.write_bytes(b"amo\n\xff\n")
+    with pytest.raises(LatinWordlistSourceReadError, match="extra.txt"):
+        collect_extra_wordlist_candidates(path=path)
+
+
 def test_directory_enumeration_failure_is_a_typed_read_error(
     tmp_path: Path, monkeypatch
 ) -> None:
@@ -86,3 +97,21 @@ def test_directory_enumeration_failure_is_a_typed_read_error(
         collect_text_candidates(
             directory=source, policy=WordlistTokenizationPolicy(""), min_length=2
         )
+
+
+def test_worker_processes_match_sequential_collection(tmp_path: Path) -> None:
+    tree = tmp_path / "tree"
+    texts = tmp_path / "texts"
+    tree.mkdir()
+    texts.mkdir()
+    for index, word in enumerate(("rosa", "amat", "deus")):
+        (tree / f"{index}.conllu").write_text(f"1\t{word.title()}\t{word}\nbad\n", encoding="utf-8")
+        (texts / f"{index}.txt").write_text(f"{word} rosa!", encoding="utf-8")
+    policy = WordlistTokenizationPolicy("")
+    for max_workers in (1, 2):
+        conllu, _ = collect_conllu_candidates(directory=tree, min_length=2, max_workers=max_workers)
+        text, _ = collect_text_candidates(directory=texts, policy=policy, min_length=2, max_workers=max_workers)
+        assert conllu.lemmas == {"rosa", "amat", "deus"}
+        assert conllu.form_counts == {"rosa": 1, "amat": 1, "deus": 1}
+        assert conllu.ignored_rows == 3
+        assert text.form_counts == {"rosa": 4, "amat": 1, "deus": 1}
@@ -70,3 +70,14 @@ def test_duplicate_paths_are_checked_after_resolution(tmp_path: Path) -> None:
     )
     with pytest.raises(LatinWordlistConfigError, match="resolves to duplicate"):
         load_wordlist_build_request(path)
+
+
+def test_request_is_cached_until_config_changes(tmp_path: Path) -> None:
+    path = tmp_path / "wordlist.yml"
+    path.write_text("filters:\n  min_length: 2\n", encoding="utf-8")
+    first = load_wordlist_build_request(path)
+    assert load_wordlist_build_request(path) is first
+    assert load_wordlist_build_request(path, max_workers=2).max_workers == 2
+
+    path.write_text("filters:\n  min_length: 33\n", encoding="utf-8")
+    assert load_wordlist_build_request(path).filters.min_length == 33
@@ -24,6 +24,17 @@ def test_tokenization_preserves_existing_semantics() -> None:
     assert words == ("rōsa", "amat", "vir", "que")
 
 
+def test_tokenization_treats_regex_metacharacters_as_plain_punctuation() -> None:
+    words = tuple(
+        iter_latin_word_candidates(
+            "rosa]amat^deus\\homo«lux»\u2028via rosa1",
+            policy=WordlistTokenizationPolicy(extra_punct="«»"),
+            min_length=2,
+        )
+    )
+    assert words == ("rosa", "amat", "deus", "homo", "lux", "via")
+
+
 def test_threshold_and_merge_are_deterministic_without_mutating_inputs() -> None:
     counts = {"rosa": 1, "amo": 2}
     conllu = ConlluCandidates((), frozenset({"lemma"}), counts)
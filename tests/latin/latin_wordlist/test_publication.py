@@ -17,6 +17,20 @@ def test_publication_writes_utf8_lines_and_replaces_existing_file(tmp_path: Path
     assert not tuple(output.parent.glob("*.tmp"))
 
 
+def test_publication_batches_match_single_join(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(publication_module, "_WRITE_BATCH_SIZE", 2)
+    output = tmp_path / "words.txt"
+    entries = ("a", "b", "c", "d", "e")
+    publish_wordlist(WordlistPublication(output, entries))
+    assert output.read_text(encoding="utf-8") == "\n".join(entries) + "\n"
+
+
+@pytest.mark.parametrize("entries", [("b", "a"), ("a", "a")])
+def test_publication_rejects_unsorted_or_duplicate_entries(entries: tuple[str, ...]) -> None:
+    with pytest.raises(ValueError, match="unique and sorted"):
+        WordlistPublication(Path("words.txt"), entries)
+
+
 def test_empty_publication_and_directory_error(tmp_path: Path) -> None:
     output = tmp_path / "empty.txt"
     publish_wordlist(WordlistPublication(output, ()))
@@ -80,3 +80,19 @@ def test_service_propagates_publication_failure(tmp_path: Path) -> None:
     )
     with pytest.raises(RuntimeError, match="publisher failed"):
         execute_latin_wordlist_build(_request(tmp_path), dependencies=dependencies)
+
+
+@pytest.mark.parametrize("max_workers, error", [(0, ValueError), (True, TypeError)])
+def test_request_rejects_invalid_worker_counts(tmp_path: Path, max_workers, error) -> None:
+    request = _request(tmp_path)
+    with pytest.raises(error):
+        LatinWordlistBuildRequest(
+            request.config_path,
+            request.conllu_dir,
+            request.latin_text_dir,
+            request.extra_wordlists,
+            request.output_path,
+            request.filters,
+            request.tokenization,
+            max_workers,
+        )
@@ -21,6 +21,12 @@ def test_massive_word_uses_safe_fixed_width_fallback() -> None:
     assert list(iter_char_chunks("abcdefghij", 4)) == ["abcd", "efgh", "ij"]
 
 
+def test_boundary_uses_any_unicode_whitespace_up_to_the_limit() -> None:
+    assert list(iter_char_chunks("ab\u3000cd\x85efgh", 5)) == ["ab\u3000cd", "\x85efgh"]
+    assert list(iter_char_chunks("abcd efgh", 4)) == ["abcd", " efg", "h"]
+    assert list(iter_char_chunks(" abcdefg", 4)) == [" abc", "defg"]
+
+
 def test_unicode_text_is_not_lost_or_duplicated() -> None:
     text = "Æneas rōmam amat"
     assert "".join(iter_char_chunks(text, 6)) == text
@@ -58,5 +58,23 @@ def test_drop_policy_handles_case_exceptions_and_normal_words() -> None:
     )
 
 
+def test_exceptions_are_resolved_once_and_only_read_for_numerals() -> None:
+    configured = frozenset({" XIV "})
+    first = effective_roman_exceptions(use_lemma=False, configured_exceptions=configured)
+    again = effective_roman_exceptions(use_lemma=False, configured_exceptions=configured)
+    assert first is again
+
+    class Unreadable(frozenset):
+        def __iter__(self):
+            raise AssertionError("exceptions must not be read for non-numerals")
+
+    assert not should_drop_roman_numeral(
+        "rosa", drop_roman_numerals=True, effective_exceptions=Unreadable()
+    )
+    assert not should_drop_roman_numeral(
+        "XIV", drop_roman_numerals=False, effective_exceptions=Unreadable()
+    )
+
+
 def test_mixed_resolver_api_is_absent() -> None:
     assert not hasattr(roman_numerals, "resolve_roman_exceptions")
@@ -24,3 +24,9 @@ def test_wordlist_preserves_file_errors(tmp_path: Path) -> None:
     invalid.write_bytes(b"\xff")
     with pytest.raises(UnicodeError):
         load_wordlist(invalid)
+
+
+def test_wordlist_splits_lines_like_read_text(tmp_path: Path) -> None:
+    path = tmp_path / "words.txt"
+    path.write_bytes("arma\r\nvirum\u2028cano\rTroiae".encode("utf-8"))
+    assert load_wordlist(path) == frozenset({"arma", "virum", "cano", "Troiae"})
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import argparse
+
+import pytest
+
+from nlpo_toolkit.cli_arguments import positive_int_argument
+
+
+def test_positive_int_argument_accepts_positive_values() -> None:
+    assert positive_int_argument("3") == 3
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "two"])
+def test_positive_int_argument_rejects_non_positive_values(value: str) -> None:
+    with pytest.raises(argparse.ArgumentTypeError, match="positive integer"):
+        positive_int_argument(value)
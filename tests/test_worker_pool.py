@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import pytest
+
+from nlpo_toolkit.worker_pool import pool_chunksize, validate_max_workers
+
+
+@pytest.mark.parametrize(
+    ("value", "error"), [(0, ValueError), (True, TypeError), (1.5, TypeError)]
+)
+def test_invalid_max_workers_are_rejected(value: object, error: type) -> None:
+    with pytest.raises(error, match="max_workers"):
+        validate_max_workers(value)
+
+
+def test_pool_chunksize_gives_each_worker_about_four_chunks() -> None:
+    assert pool_chunksize(100, 4) == 6
+    assert pool_chunksize(3, 4) == 1